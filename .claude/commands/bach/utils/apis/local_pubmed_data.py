@@ -9,6 +9,7 @@ CSV format: pmid, title, abstract, authors, journal, year, doi
 
 import os
 import logging
+from collections import defaultdict
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from pathlib import Path
@@ -37,6 +38,7 @@ class LocalPubMedDataLoader:
         self.config = config or LocalPubMedConfig()
         self.df: Optional[pd.DataFrame] = None
         self.data_path: Optional[Path] = None
+        self._index: Dict[str, List[int]] = {}
         self._initialized = False
         
         # Auto-detect data path if not provided
@@ -119,6 +121,8 @@ class LocalPubMedDataLoader:
             if final_count < initial_count:
                 logging.info(f"Filtered out {initial_count - final_count} rows with empty abstracts")
             
+            self._build_index()
+            
             logging.info(f"Loaded {final_count} articles from local PubMed data")
             self._initialized = True
             return True
@@ -127,6 +131,34 @@ class LocalPubMedDataLoader:
             logging.error(f"Failed to load local PubMed data: {e}")
             return False
     
+    def _build_index(self) -> None:
+        """Build an inverted index of whitespace tokens -> row positions in self.df"""
+        index: Dict[str, List[int]] = defaultdict(list)
+        titles = self.df['title'] if 'title' in self.df.columns else [None] * len(self.df)
+        for pos, (abstract, title) in enumerate(zip(self.df['abstract'], titles)):
+            text = str(abstract).lower()
+            if pd.notna(title):
+                text += ' ' + str(title).lower()
+            for token in set(text.split()):
+                index[token].append(pos)
+        self._index = dict(index)
+        logging.info(f"Indexed {len(self._index)} distinct tokens from local PubMed data")
+    
+    def _candidate_positions(self, query_terms: List[str]) -> List[int]:
+        """
+        Row positions whose title or abstract contains at least one query term.
+        
+        Query terms never contain whitespace, so a substring match in the text is
+        always a substring match inside a single indexed token; scanning the
+        vocabulary therefore finds exactly the rows a full scan would score > 0.
+        """
+        terms = set(query_terms)
+        positions = set()
+        for token, postings in self._index.items():
+            if any(term in token for term in terms):
+                positions.update(postings)
+        return sorted(positions)
+    
     def search(self, query: str, limit: int = 100, 
               filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
@@ -173,15 +205,27 @@ class LocalPubMedDataLoader:
                 # Normalize by number of terms
                 return score / len(query_terms) if query_terms else 0.0
             
-            # Score all articles
-            self.df['_relevance_score'] = self.df.apply(score_article, axis=1)
-            
             # Filter by minimum score
             min_score = self.config.min_match_score
             if filters and 'min_score' in filters:
                 min_score = filters['min_score']
             
-            results_df = self.df[self.df['_relevance_score'] > min_score].copy()
+            # Only rows containing a query term can score above zero, so use the
+            # inverted index to skip the rest unless the threshold admits zero scores
+            if min_score >= 0:
+                candidates_df = self.df.iloc[self._candidate_positions(query_terms)]
+            else:
+                candidates_df = self.df
+            if candidates_df.empty:
+                logging.info(f"Local PubMed search found 0 results for '{query}'")
+                return []
+            
+            # Score candidate articles (kept off self.df so concurrent searches don't race)
+            scores = candidates_df.apply(score_article, axis=1)
+            
+            matched = scores > min_score
+            results_df = candidates_df[matched].copy()
+            results_df['_relevance_score'] = scores[matched]
             
             # Apply year range filter if provided
             if filters and 'year_range' in filters:
@@ -204,10 +248,6 @@ class LocalPubMedDataLoader:
                 paper = self._row_to_standard_format(row)
                 papers.append(paper)
             
-            # Clean up temporary score column
-            if '_relevance_score' in self.df.columns:
-                self.df.drop('_relevance_score', axis=1, inplace=True)
-            
             logging.info(f"Local PubMed search found {len(papers)} results for '{query}'")
             return papers
             
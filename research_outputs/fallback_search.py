@@ -8,12 +8,55 @@ import asyncio
 import json
 import aiohttp
 import os
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 import re
 
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as etree
+    LXML_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+
+def _write_json(path, data, pretty=True):
+    """Write data as UTF-8 JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        Path(path).write_bytes(orjson.dumps(data, option=option))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2 if pretty else None, ensure_ascii=False)
+
 
 class FallbackLiteratureSearch:
+    """
+    Literature search over the Semantic Scholar and arXiv web APIs.
+
+    Use it as ``async with FallbackLiteratureSearch() as searcher:`` to share one HTTP
+    session across several searches; the session is closed on exit (or by ``aclose()``).
+    Without the context manager each top-level search opens its own session and closes
+    it once that search, including any searches it runs concurrently, has finished.
+    """
+
+    # Key terms from the atrial fibrillation query, compiled into a single alternation
+    _KEY_TERMS_RE = re.compile(
+        r'atrial fibrillation|\baf\b|cardiac|arrhythmia|heart|cardiology',
+        re.IGNORECASE
+    )
+
     def __init__(self):
         self.base_urls = {
             'semantic_scholar': 'https://api.semanticscholar.org/graph/v1',
@@ -21,6 +64,42 @@ class FallbackLiteratureSearch:
             'pubmed': 'https://eutils.ncbi.nlm.nih.gov/entrez/eutils'
         }
         self.api_key = os.getenv('SEMANTIC_SCHOLAR_API_KEY')
+        self._session = None
+        self._managed = False  # True inside "async with", which owns the session lifetime
+        self._active_searches = 0
+
+    async def __aenter__(self):
+        self._managed = True
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._managed = False
+        await self.aclose()
+
+    async def _ensure_session(self):
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @asynccontextmanager
+    async def _session_scope(self):
+        """Yield the shared session, closing it after the outermost search when unmanaged"""
+        self._active_searches += 1
+        try:
+            yield await self._ensure_session()
+        finally:
+            self._active_searches -= 1
+            if not self._managed and self._active_searches == 0:
+                await self.aclose()
 
     async def search_semantic_scholar(self, query, max_results=100):
         """Search Semantic Scholar API for literature"""
@@ -42,34 +121,34 @@ class FallbackLiteratureSearch:
             headers['x-api-key'] = self.api_key
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        papers = []
-
-                        for paper in data.get('data', []):
-                            processed_paper = {
-                                'id': paper.get('paperId'),
-                                'title': paper.get('title'),
-                                'authors': [author.get('name', '') for author in paper.get('authors', [])],
-                                'year': paper.get('year'),
-                                'abstract': paper.get('abstract'),
-                                'venue': paper.get('venue'),
-                                'journal': paper.get('journal', {}).get('name') if paper.get('journal') else None,
-                                'citationCount': paper.get('citationCount', 0),
-                                'url': paper.get('url'),
-                                'externalIds': paper.get('externalIds', {}),
-                                'database_source': 'semantic_scholar',
-                                'relevance_score': self._calculate_relevance_score(paper, query)
-                            }
-                            papers.append(processed_paper)
-
-                        print(f"Found {len(papers)} papers from Semantic Scholar")
-                        return papers
-                    else:
-                        print(f"Semantic Scholar API error: {response.status}")
-                        return []
+            async with self._session_scope() as session, \
+                    session.get(url, params=params, headers=headers) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    papers = []
+
+                    for paper in data.get('data', []):
+                        processed_paper = {
+                            'id': paper.get('paperId'),
+                            'title': paper.get('title'),
+                            'authors': [author.get('name', '') for author in paper.get('authors', [])],
+                            'year': paper.get('year'),
+                            'abstract': paper.get('abstract'),
+                            'venue': paper.get('venue'),
+                            'journal': paper.get('journal', {}).get('name') if paper.get('journal') else None,
+                            'citationCount': paper.get('citationCount', 0),
+                            'url': paper.get('url'),
+                            'externalIds': paper.get('externalIds', {}),
+                            'database_source': 'semantic_scholar',
+                            'relevance_score': self._calculate_relevance_score(paper, query)
+                        }
+                        papers.append(processed_paper)
+
+                    print(f"Found {len(papers)} papers from Semantic Scholar")
+                    return papers
+                else:
+                    print(f"Semantic Scholar API error: {response.status}")
+                    return []
 
         except Exception as e:
             print(f"Error searching Semantic Scholar: {e}")
@@ -91,84 +170,75 @@ class FallbackLiteratureSearch:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.base_urls['arxiv'], params=params) as response:
-                    if response.status == 200:
-                        import xml.etree.ElementTree as ET
-                        xml_content = await response.text()
-                        root = ET.fromstring(xml_content)
-
-                        papers = []
-                        namespace = {'atom': 'http://www.w3.org/2005/Atom',
-                                   'arxiv': 'http://arxiv.org/schemas/atom'}
-
-                        for entry in root.findall('atom:entry', namespace):
-                            title = entry.find('atom:title', namespace).text.strip()
-                            summary = entry.find('atom:summary', namespace).text.strip()
-
-                            # Extract publication date
-                            published = entry.find('atom:published', namespace)
-                            year = int(published.text.split('-')[0]) if published else None
-
-                            # Extract authors
-                            authors = []
-                            for author in entry.findall('atom:author', namespace):
-                                name = author.find('atom:name', namespace).text
-                                authors.append(name)
-
-                            # Extract arXiv ID and URL
-                            arxiv_id = entry.find('atom:id', namespace).text.split('/')[-1]
-                            url = entry.find('atom:id', namespace).text
-
-                            paper = {
-                                'id': arxiv_id,
-                                'title': title,
-                                'authors': authors,
-                                'year': year,
-                                'abstract': summary,
-                                'venue': 'arXiv',
-                                'journal': None,
-                                'citationCount': 0,  # arXiv doesn't provide citation count
-                                'url': url,
-                                'externalIds': {'arxiv': arxiv_id},
-                                'database_source': 'arxiv',
-                                'relevance_score': self._calculate_relevance_score({'title': title, 'abstract': summary}, query)
-                            }
+            async with self._session_scope() as session, \
+                    session.get(self.base_urls['arxiv'], params=params) as response:
+                if response.status == 200:
+                    # Feed the body to a pull parser as it downloads so entries are
+                    # handled (and freed) while the rest of the feed is still arriving
+                    parser = etree.XMLPullParser(events=('end',))
+                    papers = []
+
+                    async for chunk in response.content.iter_chunked(65536):
+                        parser.feed(chunk)
+                        for _, element in parser.read_events():
+                            if element.tag != f'{ATOM_NS}entry':
+                                continue
+                            paper = self._parse_arxiv_entry(element, query)
+                            element.clear()
 
                             # Filter by publication year
-                            if year and 2019 <= year <= 2024:
+                            if paper['year'] and 2019 <= paper['year'] <= 2024:
                                 papers.append(paper)
 
-                        print(f"Found {len(papers)} papers from arXiv")
-                        return papers
-                    else:
-                        print(f"arXiv API error: {response.status}")
-                        return []
+                    print(f"Found {len(papers)} papers from arXiv")
+                    return papers
+                else:
+                    print(f"arXiv API error: {response.status}")
+                    return []
 
         except Exception as e:
             print(f"Error searching arXiv: {e}")
             return []
 
+    def _parse_arxiv_entry(self, entry, query):
+        """Convert a single Atom <entry> element into a paper record"""
+        title = (entry.findtext(f'{ATOM_NS}title') or '').strip()
+        summary = (entry.findtext(f'{ATOM_NS}summary') or '').strip()
+
+        # Extract publication date
+        published = entry.findtext(f'{ATOM_NS}published')
+        year = int(published.split('-')[0]) if published else None
+
+        # Extract authors
+        authors = [author.findtext(f'{ATOM_NS}name') for author in entry.iterfind(f'{ATOM_NS}author')]
+
+        # Extract arXiv ID and URL
+        url = entry.findtext(f'{ATOM_NS}id') or ''
+        arxiv_id = url.split('/')[-1]
+
+        return {
+            'id': arxiv_id,
+            'title': title,
+            'authors': authors,
+            'year': year,
+            'abstract': summary,
+            'venue': 'arXiv',
+            'journal': None,
+            'citationCount': 0,  # arXiv doesn't provide citation count
+            'url': url,
+            'externalIds': {'arxiv': arxiv_id},
+            'database_source': 'arxiv',
+            'relevance_score': self._calculate_relevance_score({'title': title, 'abstract': summary}, query)
+        }
+
     def _calculate_relevance_score(self, paper, query):
         """Calculate basic relevance score based on title and abstract matching"""
-        title = (paper.get('title') or '').lower()
-        abstract = (paper.get('abstract') or '').lower()
-        query_lower = query.lower()
-
-        # Extract key terms from query
-        key_terms = ['atrial fibrillation', 'af', 'cardiac', 'arrhythmia', 'heart', 'cardiology']
-
-        score = 0
+        # One regex scan per field; each distinct key term found scores once
+        title_terms = {term.lower() for term in self._KEY_TERMS_RE.findall(paper.get('title') or '')}
+        abstract_terms = {term.lower() for term in self._KEY_TERMS_RE.findall(paper.get('abstract') or '')}
 
-        # Title matching (higher weight)
-        for term in key_terms:
-            if term in title:
-                score += 20
-
-        # Abstract matching
-        for term in key_terms:
-            if term in abstract:
-                score += 10
+        # Title matching (higher weight), then abstract matching
+        score = 20 * len(title_terms) + 10 * len(abstract_terms)
 
         # Recent publication bonus
         year = paper.get('year')
@@ -190,21 +260,23 @@ class FallbackLiteratureSearch:
 
         all_results = {}
 
-        # Try Semantic Scholar first
-        try:
-            semantic_results = await self.search_semantic_scholar("atrial fibrillation", max_results_per_source)
-            all_results['semantic_scholar'] = semantic_results
-        except Exception as e:
-            print(f"Error with Semantic Scholar: {e}")
-            all_results['semantic_scholar'] = []
+        # Sources are independent, so query them concurrently over the shared session
+        async with self._session_scope():
+            semantic_results, arxiv_results = await asyncio.gather(
+                self.search_semantic_scholar("atrial fibrillation", max_results_per_source),
+                self.search_arxiv("atrial fibrillation cardiac", max_results_per_source),
+                return_exceptions=True
+            )
 
-        # Try arXiv with cardiac focus
-        try:
-            arxiv_results = await self.search_arxiv("atrial fibrillation cardiac", max_results_per_source)
-            all_results['arxiv'] = arxiv_results
-        except Exception as e:
-            print(f"Error with arXiv: {e}")
-            all_results['arxiv'] = []
+        if isinstance(semantic_results, Exception):
+            print(f"Error with Semantic Scholar: {semantic_results}")
+            semantic_results = []
+        all_results['semantic_scholar'] = semantic_results
+
+        if isinstance(arxiv_results, Exception):
+            print(f"Error with arXiv: {arxiv_results}")
+            arxiv_results = []
+        all_results['arxiv'] = arxiv_results
 
         return all_results
 
@@ -215,14 +287,16 @@ class FallbackLiteratureSearch:
         seen_papers = set()
         deduplicated_papers = []
 
-        for source, papers in all_results.items():
+        for papers in all_results.values():
             for paper in papers:
-                # Create unique identifier based on title and authors
-                title = paper.get('title', '').lower().strip()
-                first_author = paper.get('authors', [''])[0].lower() if paper.get('authors') else ''
-                year = paper.get('year', 0)
-
-                identifier = f"{title}_{first_author}_{year}"
+                # Unique identifier based on title, first author and year; a tuple key
+                # hashes its parts directly instead of formatting a combined string
+                authors = paper.get('authors')
+                identifier = (
+                    (paper.get('title') or '').lower().strip(),
+                    (authors[0] or '').lower() if authors else '',
+                    paper.get('year', 0)
+                )
 
                 if identifier not in seen_papers:
                     seen_papers.add(identifier)
@@ -240,11 +314,11 @@ async def execute_fallback_search():
     print("=== Fallback Literature Search Implementation ===")
     print("Executing comprehensive search for Atrial Fibrillation...\n")
 
-    searcher = FallbackLiteratureSearch()
     query = "atrial fibrillation cardiac arrhythmia heart cardiology"
 
     # Execute search
-    all_results = await searcher.execute_comprehensive_search(query)
+    async with FallbackLiteratureSearch() as searcher:
+        all_results = await searcher.execute_comprehensive_search(query)
 
     # Deduplicate and rank results
     final_papers = searcher.deduplicate_results(all_results)
@@ -272,8 +346,8 @@ async def execute_fallback_search():
         "results": final_papers
     }
 
-    with open(comprehensive_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    # Machine-readable only, so skip pretty-printing
+    _write_json(comprehensive_file, output_data, pretty=False)
 
     print(f"\n=== SEARCH RESULTS ===")
     print(f"Total unique papers found: {len(final_papers)}")
@@ -322,8 +396,7 @@ async def execute_fallback_search():
         ]
     }
 
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(summary_data, f, indent=2, ensure_ascii=False)
+    _write_json(summary_file, summary_data)
 
     print(f"\nResults saved to: {comprehensive_file}")
     print(f"Summary saved to: {summary_file}")
@@ -5,17 +5,158 @@ Uses local PubMed data + remote APIs for comprehensive coverage
 """
 
 import asyncio
+import hashlib
+import heapq
+import io
 import json
 import os
+import random
+import re
 import sys
+import time
+from collections import Counter, deque
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+from urllib.parse import urlsplit
 from typing import Dict, List, Any
 
+import numpy as np
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as etree
+    LXML_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from rapidfuzz import fuzz, process, utils as fuzz_utils
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 # Add Bach utilities to path
 sys.path.append('.claude/commands/bach/utils')
 sys.path.append('.claude/commands/bach/utils/apis')
 
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+SEARCH_CACHE_DIR = Path("research_outputs/.search_cache")
+SEARCH_CACHE_TTL = 24 * 60 * 60  # Remote API responses are reused for a day
+SEARCH_CACHE_MAX_ENTRIES = 512  # Least recently used responses beyond this are pruned
+MAX_CONCURRENT_REQUESTS = 8
+S2_PAGE_SIZE = 100
+S2_MAX_RESULTS_PER_QUERY = 300
+S2_FIELDS = "title,abstract,authors,year,citationCount,venue,url,doi"
+MAX_REQUEST_ATTEMPTS = 5
+REQUEST_TIMEOUT = 30  # Seconds allowed for a whole remote API request, including reading the body
+_NON_WORD_RE = re.compile(r"\W+")
+
+
+def _title_key(title):
+    """Canonical 8-byte digest of a title (lowercased, punctuation stripped, whitespace collapsed)."""
+    normalized = _NON_WORD_RE.sub(" ", title.lower()).strip()
+    return hashlib.blake2b(normalized.encode(), digest_size=8).digest()
+
+
+class RateLimiter:
+    """Sliding-window limiter allowing at most `calls` requests per `window` seconds."""
+
+    def __init__(self, calls, window):
+        self.calls = calls
+        self.window = window
+        self._timestamps = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until another request may start."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._timestamps and now - self._timestamps[0] >= self.window:
+                    self._timestamps.popleft()
+                if len(self._timestamps) < self.calls:
+                    self._timestamps.append(now)
+                    return
+                await asyncio.sleep(self.window - (now - self._timestamps[0]))
+
+
+def _encode_json(data):
+    """Encode data as indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _write_json(path, data):
+    """Encode data as indented JSON and write it to path."""
+    Path(path).write_bytes(_encode_json(data))
+
+
+def _build_term_automaton(terms):
+    """Build an Aho-Corasick automaton whose payload for each keyword is the keyword itself."""
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_term_pattern(terms):
+    """
+    Build a single regex reporting the shortest keyword starting at each position.
+
+    Returns (pattern, extensions) where extensions maps each keyword to the longer
+    keywords it is a prefix of; those are the only other keywords that can start
+    at the same position, so checking them recovers every overlapping match.
+    """
+    ordered = sorted(terms, key=len)
+    pattern = re.compile("(?=(%s))" % "|".join(map(re.escape, ordered)))
+    extensions = {term: tuple(other for other in ordered if other != term and other.startswith(term))
+                  for term in terms}
+    return pattern, extensions
+
+
 class PediatricCardiologyMLSearch:
+    # Focused subqueries shared by the local PubMed and Semantic Scholar searches
+    SUBQUERIES = (
+        "pediatric cardiology machine learning",
+        "children heart disease artificial intelligence",
+        "congenital heart defect deep learning",
+        "pediatric cardiac neural network",
+        "children echocardiogram AI"
+    )
+
+    # Keywords a paper needs (one from each group) to count as pediatric cardiology ML
+    RELEVANCE_PEDIATRIC_TERMS = frozenset(["pediatric", "paediatric", "children", "child", "infant", "neonatal", "newborn", "adolescent"])
+    RELEVANCE_CARDIOLOGY_TERMS = frozenset(["cardiology", "cardiac", "heart", "congenital heart", "chd", "echocardiogram", "ecg", "electrocardiogram"])
+    RELEVANCE_ML_TERMS = frozenset(["machine learning", "artificial intelligence", "ai", "deep learning", "neural network", "algorithm", "predictive model"])
+
+    # Keywords counted towards the relevance score
+    SCORE_PEDIATRIC_TERMS = frozenset(["pediatric", "children", "child", "infant", "neonatal"])
+    SCORE_CARDIOLOGY_TERMS = frozenset(["cardiology", "cardiac", "heart", "congenital"])
+    SCORE_ML_TERMS = frozenset(["machine learning", "deep learning", "neural network", "ai", "algorithm"])
+
+    # Per-keyword weight and per-group cap for pediatric, cardiology and ML matches (40/30/20%)
+    SCORE_WEIGHTS = np.array([0.1, 0.075, 0.05])
+    SCORE_CAPS = np.array([0.4, 0.3, 0.2])
+
+    ALL_TERMS = (RELEVANCE_PEDIATRIC_TERMS | RELEVANCE_CARDIOLOGY_TERMS | RELEVANCE_ML_TERMS
+                 | SCORE_PEDIATRIC_TERMS | SCORE_CARDIOLOGY_TERMS | SCORE_ML_TERMS)
+
     def __init__(self):
         self.search_config = self.load_search_config()
         self.results = {
@@ -35,6 +176,125 @@ class PediatricCardiologyMLSearch:
             "results": [],
             "quality_assessment": {}
         }
+        self._config_fingerprint = hashlib.md5(
+            json.dumps(self.search_config, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        self._seen = {}
+        self._session = None
+        self._request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._rate_limiters = {
+            "api.semanticscholar.org": RateLimiter(1, 1),  # Unauthenticated shared pool
+            "export.arxiv.org": RateLimiter(1, 3)  # arXiv asks for one request every 3 seconds
+        }
+        self._term_automaton = _build_term_automaton(self.ALL_TERMS) if AHOCORASICK_AVAILABLE else None
+        self._term_pattern, self._term_extensions = _build_term_pattern(self.ALL_TERMS)
+
+    async def _ensure_session(self):
+        """Return the HTTP session shared by all remote searches, creating it lazily."""
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            connector = aiohttp.TCPConnector(limit=128, limit_per_host=64, ttl_dns_cache=300)
+            timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    async def aclose(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _fetch(self, url, params=None, label="Remote API", as_text=False):
+        """GET a remote API with bounded concurrency, per-host rate limiting and retries.
+
+        429/5xx responses, connection errors and timeouts are retried with backoff.
+        Returns the decoded JSON (or text when as_text is set), or None if the request failed.
+        """
+        import aiohttp
+
+        host = urlsplit(url).hostname
+        limiter = self._rate_limiters.get(host)
+        session = await self._ensure_session()
+
+        for attempt in range(MAX_REQUEST_ATTEMPTS):
+            if limiter:
+                await limiter.acquire()
+            retry_after = ""
+            async with self._request_semaphore:
+                try:
+                    async with session.get(url, params=params) as response:
+                        if response.status == 200:
+                            return await response.text() if as_text else await response.json()
+                        if response.status != 429 and response.status < 500:
+                            print(f"❌ {label} API error: {response.status}")
+                            return None
+                        problem = f"returned {response.status}"
+                        retry_after = response.headers.get("Retry-After", "")
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    problem = f"request failed ({type(e).__name__}: {e})"
+
+            if attempt == MAX_REQUEST_ATTEMPTS - 1:
+                break
+
+            # Back off outside the semaphore so other requests can use the slot
+            delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt + random.random()
+            print(f"⚠️ {label} {problem}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+        print(f"❌ {label} API error: giving up after {MAX_REQUEST_ATTEMPTS} attempts ({problem})")
+        return None
+
+    def _cache_path(self, source, url, params):
+        """Cache file for an API call, keyed on the call and the active search config."""
+        key_data = f"{source}:{url}:{json.dumps(params, sort_keys=True)}:{self._config_fingerprint}"
+        return SEARCH_CACHE_DIR / f"{hashlib.md5(key_data.encode()).hexdigest()}.json"
+
+    def _cache_get(self, source, url, params):
+        """Return a cached API response, or None if missing or older than the TTL.
+
+        Expired entries are deleted; hits refresh the file's mtime, which orders LRU pruning.
+        """
+        path = self._cache_path(source, url, params)
+        try:
+            with open(path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("timestamp", 0) > SEARCH_CACHE_TTL:
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("data")
+
+    def _cache_set(self, source, url, params, data):
+        """Store an API response on disk, pruning the least recently used entries above the cap."""
+        try:
+            SEARCH_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_path(source, url, params), 'w') as f:
+                json.dump({"timestamp": time.time(), "data": data}, f, ensure_ascii=False)
+            self._prune_cache()
+        except OSError as e:
+            print(f"⚠️ Could not cache {source} response: {e}")
+
+    @staticmethod
+    def _prune_cache():
+        """Delete the least recently used cache files beyond SEARCH_CACHE_MAX_ENTRIES."""
+        with os.scandir(SEARCH_CACHE_DIR) as it:
+            entries = [entry for entry in it if entry.name.endswith(".json") and entry.is_file()]
+        excess = len(entries) - SEARCH_CACHE_MAX_ENTRIES
+        if excess <= 0:
+            return
+        for entry in heapq.nsmallest(excess, entries, key=lambda entry: entry.stat().st_mtime):
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
 
     def load_search_config(self):
         """Load search configuration from JSON file."""
@@ -61,29 +321,31 @@ class PediatricCardiologyMLSearch:
         print("🚀 Starting Pediatric Cardiology ML Literature Search")
         print("=" * 60)
 
-        # Phase 1: Local PubMed Search
-        print("\n📚 Phase 1: Local PubMed Database Search")
-        local_papers = await self.search_local_pubmed()
-        self.results["search_metadata"]["databases_searched"].append("local_pubmed")
-        self.results["results"].extend(local_papers)
-
-        # Phase 2: Semantic Scholar Search
-        print("\n🌐 Phase 2: Semantic Scholar API Search")
-        semantic_papers = await self.search_semantic_scholar()
-        if semantic_papers:
-            self.results["search_metadata"]["databases_searched"].append("semantic_scholar")
-            self.results["results"].extend(semantic_papers)
-
-        # Phase 3: arXiv Search
-        print("\n📄 Phase 3: arXiv Preprint Search")
-        arxiv_papers = await self.search_arxiv()
-        if arxiv_papers:
-            self.results["search_metadata"]["databases_searched"].append("arxiv")
-            self.results["results"].extend(arxiv_papers)
-
-        # Phase 4: Deduplication and Ranking
+        # Phases 1-3: Local PubMed, Semantic Scholar and arXiv are independent,
+        # so run them concurrently and merge in a fixed order afterwards
+        print("\n📚 Phase 1-3: Local PubMed, Semantic Scholar and arXiv Search")
+        phase_results = await asyncio.gather(
+            self.search_local_pubmed(),
+            self.search_semantic_scholar(),
+            self.search_arxiv(),
+            return_exceptions=True
+        )
+
+        searched = []
+        for database, papers in zip(("local_pubmed", "semantic_scholar", "arxiv"), phase_results):
+            if isinstance(papers, Exception):
+                print(f"❌ {database} search failed: {papers}")
+                continue
+            # Local PubMed is always recorded as searched; remote sources only when they returned papers
+            if papers or database == "local_pubmed":
+                self.results["search_metadata"]["databases_searched"].append(database)
+                searched.append(papers)
+                self.merge_unique(papers)
+        self.results["results"] = list(chain.from_iterable(searched))
+
+        # Phase 4: Deduplication
         print("\n🔍 Phase 4: Deduplication and Quality Ranking")
-        deduplicated_results = self.deduplicate_and_rank()
+        deduplicated_results = self.deduplicate()
 
         # Phase 5: Final Curation
         print("\n📊 Phase 5: Final Curation and Analysis")
@@ -106,19 +368,12 @@ class PediatricCardiologyMLSearch:
                 print("❌ Failed to initialize local PubMed loader")
                 return []
 
-            # Search with multiple query terms
-            queries = [
-                "pediatric cardiology machine learning",
-                "children heart disease artificial intelligence",
-                "congenital heart defect deep learning",
-                "pediatric cardiac neural network",
-                "children echocardiogram AI"
-            ]
+            # Run the subqueries in worker threads so the remote searches keep progressing
+            per_query_papers = await asyncio.gather(
+                *(asyncio.to_thread(loader.search, query, 50) for query in self.SUBQUERIES)
+            )
 
-            all_papers = []
-            for query in queries:
-                papers = loader.search(query, limit=50)
-                all_papers.extend(papers)
+            all_papers = list(chain.from_iterable(per_query_papers))
 
             # Remove duplicates and add relevance scoring
             unique_papers = self.remove_duplicates(all_papers)
@@ -131,48 +386,76 @@ class PediatricCardiologyMLSearch:
             print(f"❌ Local PubMed search failed: {e}")
             return []
 
+    async def _fetch_semantic_scholar_page(self, url, query, offset):
+        """Fetch one page of Semantic Scholar results, from the cache when possible.
+
+        Returns {} if the page could not be fetched, so one failed page never discards the others.
+        """
+        params = {
+            "query": query,
+            "offset": offset,
+            "limit": S2_PAGE_SIZE,
+            "fields": S2_FIELDS
+        }
+        try:
+            data = self._cache_get("semantic_scholar", url, params)
+            if data is None:
+                data = await self._fetch(url, params, label="Semantic Scholar")
+                if data is None:
+                    return {}
+                self._cache_set("semantic_scholar", url, params, data)
+        except Exception as e:
+            print(f"❌ Semantic Scholar page failed ({query!r}, offset {offset}): {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
+
     async def search_semantic_scholar(self):
         """Search Semantic Scholar API."""
         try:
-            import aiohttp
-
-            query = "pediatric cardiology machine learning OR children heart disease AI OR congenital heart defect deep learning"
             url = "https://api.semanticscholar.org/graph/v1/paper/search"
-            params = {
-                "query": query,
-                "limit": 100,
-                "fields": "title,abstract,authors,year,citationCount,venue,url,doi"
-            }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        papers = []
-                        for paper in data.get("data", []):
-                            # Filter for pediatric relevance
-                            if self.is_pediatric_cardiology_relevant(paper):
-                                processed_paper = {
-                                    "id": paper.get("paperId"),
-                                    "title": paper.get("title"),
-                                    "authors": [a.get("name", "") for a in paper.get("authors", [])],
-                                    "year": paper.get("year"),
-                                    "abstract": paper.get("abstract"),
-                                    "venue": paper.get("venue"),
-                                    "doi": paper.get("doi"),
-                                    "url": paper.get("url"),
-                                    "citation_count": paper.get("citationCount", 0),
-                                    "database_source": "semantic_scholar",
-                                    "relevance_score": 0.0
-                                }
-                                papers.append(processed_paper)
-
-                        scored_papers = self.score_relevance(papers, "semantic_scholar")
-                        print(f"✅ Found {len(scored_papers)} relevant papers from Semantic Scholar")
-                        return scored_papers
-                    else:
-                        print(f"❌ Semantic Scholar API error: {response.status}")
-                        return []
+            # First page of every subquery in parallel, then any further pages the totals call for
+            first_pages = await asyncio.gather(
+                *(self._fetch_semantic_scholar_page(url, query, 0) for query in self.SUBQUERIES)
+            )
+            later_requests = [
+                (query, offset)
+                for query, page in zip(self.SUBQUERIES, first_pages)
+                for offset in range(S2_PAGE_SIZE, min(page.get("total", 0), S2_MAX_RESULTS_PER_QUERY), S2_PAGE_SIZE)
+            ]
+            later_pages = await asyncio.gather(
+                *(self._fetch_semantic_scholar_page(url, query, offset) for query, offset in later_requests)
+            )
+
+            # Union the pages on paperId before relevance filtering
+            raw_papers = {}
+            for page in (*first_pages, *later_pages):
+                for paper in page.get("data", []):
+                    raw_papers.setdefault(paper.get("paperId") or id(paper), paper)
+
+            papers = []
+            for paper in raw_papers.values():
+                # Filter for pediatric relevance
+                if self.is_pediatric_cardiology_relevant(paper):
+                    processed_paper = {
+                        "id": paper.get("paperId"),
+                        "title": paper.get("title"),
+                        "authors": [a.get("name", "") for a in paper.get("authors", [])],
+                        "year": paper.get("year"),
+                        "abstract": paper.get("abstract"),
+                        "venue": paper.get("venue"),
+                        "doi": paper.get("doi"),
+                        "url": paper.get("url"),
+                        "citation_count": paper.get("citationCount", 0),
+                        "database_source": "semantic_scholar",
+                        "relevance_score": 0.0,
+                        "_terms": paper["_terms"]  # Already matched by the relevance filter
+                    }
+                    papers.append(processed_paper)
+
+            scored_papers = self.score_relevance(papers, "semantic_scholar")
+            print(f"✅ Found {len(scored_papers)} relevant papers from Semantic Scholar")
+            return scored_papers
         except Exception as e:
             print(f"❌ Semantic Scholar search failed: {e}")
             return []
@@ -180,205 +463,220 @@ class PediatricCardiologyMLSearch:
     async def search_arxiv(self):
         """Search arXiv for relevant preprints."""
         try:
-            import aiohttp
-
             query = "all:\"pediatric cardiology\" AND all:\"machine learning\" OR all:\"children\" AND all:\"cardiac\" AND all:\"neural network\""
             url = f"http://export.arxiv.org/api/query?search_query={query}&start=0&max_results=50"
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        xml_content = await response.text()
-                        papers = self.parse_arxiv_response(xml_content)
-
-                        # Filter for relevance
-                        relevant_papers = [p for p in papers if self.is_pediatric_cardiology_relevant(p)]
-                        scored_papers = self.score_relevance(relevant_papers, "arxiv")
-
-                        print(f"✅ Found {len(scored_papers)} relevant papers from arXiv")
-                        return scored_papers
-                    else:
-                        print(f"❌ arXiv API error: {response.status}")
-                        return []
+            xml_content = self._cache_get("arxiv", url, {})
+            if xml_content is None:
+                xml_content = await self._fetch(url, label="arXiv", as_text=True)
+                if xml_content is None:
+                    return []
+                self._cache_set("arxiv", url, {}, xml_content)
+
+            papers = self.parse_arxiv_response(xml_content)
+
+            # Filter for relevance
+            relevant_papers = [p for p in papers if self.is_pediatric_cardiology_relevant(p)]
+            scored_papers = self.score_relevance(relevant_papers, "arxiv")
+
+            print(f"✅ Found {len(scored_papers)} relevant papers from arXiv")
+            return scored_papers
         except Exception as e:
             print(f"❌ arXiv search failed: {e}")
             return []
 
     def parse_arxiv_response(self, xml_content):
-        """Parse arXiv XML response."""
-        papers = []
-        if "<entry>" in xml_content:
-            entries = xml_content.split("<entry>")[1:]  # Skip first part
-            for entry in entries:
-                if "</entry>" in entry:
-                    entry_content = entry.split("</entry>")[0]
-                    paper = self.extract_arxiv_paper(entry_content)
-                    if paper:
-                        papers.append(paper)
-        return papers
+        """Parse arXiv Atom XML response in a single streaming pass."""
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode("utf-8")
 
-    def extract_arxiv_paper(self, entry):
-        """Extract paper information from arXiv entry."""
-        try:
-            title = self.extract_xml_tag(entry, "title")
-            summary = self.extract_xml_tag(entry, "summary")
-            paper_id = self.extract_xml_tag(entry, "id")
+        papers = []
+        for _, entry in etree.iterparse(io.BytesIO(xml_content), events=("end",)):
+            if entry.tag != f"{ATOM_NS}entry":
+                continue
 
+            title = entry.findtext(f"{ATOM_NS}title")
+            summary = entry.findtext(f"{ATOM_NS}summary")
             if title and summary:
-                return {
-                    "id": paper_id.split("/")[-1] if paper_id else "",
+                paper_id = entry.findtext(f"{ATOM_NS}id") or ""
+                authors = [a.findtext(f"{ATOM_NS}name") for a in entry.iterfind(f"{ATOM_NS}author")]
+                published = entry.findtext(f"{ATOM_NS}published") or ""
+                try:
+                    year = int(published.split("-")[0])
+                except ValueError:
+                    year = 2024  # Default
+
+                papers.append({
+                    "id": paper_id.split("/")[-1],
                     "title": title.strip(),
                     "abstract": summary.strip(),
-                    "authors": self.extract_arxiv_authors(entry),
-                    "year": self.extract_year_from_arxiv_entry(entry),
+                    "authors": [name for name in authors if name],
+                    "year": year,
                     "url": paper_id,
                     "database_source": "arxiv",
                     "citation_count": 0,  # arXiv doesn't provide citation count
                     "relevance_score": 0.0
-                }
-        except Exception:
-            pass
-        return None
+                })
 
-    def extract_xml_tag(self, content, tag):
-        """Extract content between XML tags."""
-        start_tag = f"<{tag}>"
-        end_tag = f"</{tag}>"
+            # Entries are independent; free each one once it has been converted
+            entry.clear()
 
-        if start_tag in content and end_tag in content:
-            start = content.find(start_tag) + len(start_tag)
-            end = content.find(end_tag, start)
-            return content[start:end]
-        return None
+        return papers
 
-    def extract_arxiv_authors(self, entry):
-        """Extract authors from arXiv entry."""
-        authors = []
-        if "<author>" in entry:
-            author_entries = entry.split("<author>")[1:]
-            for author_entry in author_entries:
-                if "</author>" in author_entry:
-                    name = self.extract_xml_tag(author_entry, "name")
-                    if name:
-                        authors.append(name)
-        return authors
-
-    def extract_year_from_arxiv_entry(self, entry):
-        """Extract year from arXiv entry."""
-        try:
-            published = self.extract_xml_tag(entry, "published")
-            if published:
-                return int(published.split("-")[0])
-        except Exception:
-            pass
-        return 2024  # Default
+    @staticmethod
+    def _normalized_text(paper):
+        """Lowercased "title abstract" text used for keyword matching."""
+        return f"{paper.get('title') or ''} {paper.get('abstract') or ''}".lower()
+
+    def _matched_terms(self, text):
+        """Return the set of known keywords occurring (as substrings) in the lowercased text."""
+        if self._term_automaton is not None:
+            return frozenset(term for _, term in self._term_automaton.iter(text))
+        found = set()
+        for match in self._term_pattern.finditer(text):
+            term = match.group(1)
+            found.add(term)
+            for longer in self._term_extensions[term]:
+                if text.startswith(longer, match.start()):
+                    found.add(longer)
+        return frozenset(found)
+
+    def _paper_terms(self, paper):
+        """Keywords matched in a paper, computed once and cached on the paper as _terms."""
+        found = paper.get("_terms")
+        if found is None:
+            found = self._matched_terms(self._normalized_text(paper))
+            paper["_terms"] = found
+        return found
 
     def is_pediatric_cardiology_relevant(self, paper):
         """Check if paper is relevant to pediatric cardiology ML."""
-        title = (paper.get("title", "") or "").lower()
-        abstract = (paper.get("abstract", "") or "").lower()
-        text = f"{title} {abstract}"
-
-        # Pediatric keywords
-        pediatric_terms = ["pediatric", "paediatric", "children", "child", "infant", "neonatal", "newborn", "adolescent"]
-        # Cardiology keywords
-        cardiology_terms = ["cardiology", "cardiac", "heart", "congenital heart", "chd", "echocardiogram", "ecg", "electrocardiogram"]
-        # ML keywords
-        ml_terms = ["machine learning", "artificial intelligence", "ai", "deep learning", "neural network", "algorithm", "predictive model"]
-
-        has_pediatric = any(term in text for term in pediatric_terms)
-        has_cardiology = any(term in text for term in cardiology_terms)
-        has_ml = any(term in text for term in ml_terms)
+        found = self._paper_terms(paper)
+        has_pediatric = not found.isdisjoint(self.RELEVANCE_PEDIATRIC_TERMS)
+        has_cardiology = not found.isdisjoint(self.RELEVANCE_CARDIOLOGY_TERMS)
+        has_ml = not found.isdisjoint(self.RELEVANCE_ML_TERMS)
 
         return has_pediatric and has_cardiology and has_ml
 
     def remove_duplicates(self, papers):
-        """Remove duplicate papers based on title similarity."""
-        seen_titles = set()
+        """Remove duplicate papers based on canonical title."""
+        seen_keys = set()
         unique_papers = []
 
         for paper in papers:
-            title = paper.get("title", "").lower().strip()
-            if title and title not in seen_titles:
-                seen_titles.add(title)
+            title = paper.get("title") or ""
+            if not title.strip():
+                continue
+            key = _title_key(title)
+            if key not in seen_keys:
+                seen_keys.add(key)
                 unique_papers.append(paper)
 
         return unique_papers
 
     def score_relevance(self, papers, source):
         """Score papers for relevance to pediatric cardiology ML."""
-        for paper in papers:
-            title = (paper.get("title", "") or "").lower()
-            abstract = (paper.get("abstract", "") or "").lower()
-            text = f"{title} {abstract}"
-
-            score = 0.0
-
-            # Pediatric relevance (40% weight)
-            pediatric_terms = ["pediatric", "children", "child", "infant", "neonatal"]
-            pediatric_count = sum(1 for term in pediatric_terms if term in text)
-            score += min(pediatric_count * 0.1, 0.4)
-
-            # Cardiology relevance (30% weight)
-            cardiology_terms = ["cardiology", "cardiac", "heart", "congenital"]
-            cardiology_count = sum(1 for term in cardiology_terms if term in text)
-            score += min(cardiology_count * 0.075, 0.3)
-
-            # ML relevance (20% weight)
-            ml_terms = ["machine learning", "deep learning", "neural network", "ai", "algorithm"]
-            ml_count = sum(1 for term in ml_terms if term in text)
-            score += min(ml_count * 0.05, 0.2)
-
-            # Quality indicators (10% weight)
-            if source == "semantic_scholar" and paper.get("citation_count", 0) > 5:
-                score += 0.05
-            if paper.get("year", 2020) >= 2022:
-                score += 0.05
-
-            paper["relevance_score"] = min(score, 1.0)
-
-        return sorted(papers, key=lambda x: x["relevance_score"], reverse=True)
-
-    def deduplicate_and_rank(self):
-        """Remove duplicates across sources and rank by relevance."""
-        # Group by title similarity
-        unique_papers = []
-        seen_titles = set()
-
-        for paper in self.results["results"]:
-            title = paper.get("title", "").lower().strip()
-            if title and title not in seen_titles:
-                seen_titles.add(title)
-                unique_papers.append(paper)
+        if not papers:
+            return papers
+
+        # Keyword hits per paper: columns are pediatric, cardiology and ML matches
+        counts = np.empty((len(papers), 3))
+        for i, paper in enumerate(papers):
+            found = self._paper_terms(paper)
+            counts[i] = (len(found & self.SCORE_PEDIATRIC_TERMS),
+                         len(found & self.SCORE_CARDIOLOGY_TERMS),
+                         len(found & self.SCORE_ML_TERMS))
+
+        scores = np.minimum(counts * self.SCORE_WEIGHTS, self.SCORE_CAPS).sum(axis=1)
+
+        # Quality indicators (10% weight)
+        if source == "semantic_scholar":
+            citations = np.array([paper.get("citation_count") or 0 for paper in papers])
+            scores += 0.05 * (citations > 5)
+        years = np.array([paper.get("year") or 2020 for paper in papers])
+        scores += 0.05 * (years >= 2022)
+
+        for paper, score in zip(papers, np.minimum(scores, 1.0).tolist()):
+            paper["relevance_score"] = score
+
+        # Ordering happens once, globally, in curate_final_results
+        return papers
 
-        return sorted(unique_papers, key=lambda x: x["relevance_score"], reverse=True)
+    def merge_unique(self, papers):
+        """Merge papers into the cross-source index, keeping the best-scored copy per canonical title."""
+        for paper in papers:
+            title = paper.get("title") or ""
+            if not title.strip():
+                continue
+            key = _title_key(title)
+            current = self._seen.get(key)
+            if current is None or paper["relevance_score"] > current["relevance_score"]:
+                self._seen[key] = paper
+
+    def collapse_near_duplicates(self, papers, threshold=92, batch_size=2048):
+        """Collapse papers whose titles differ only by typos/punctuation, keeping the best-scored one."""
+        titles = [p["title"] for p in papers]
+        parent = list(range(len(papers)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # Compare one block of rows against all titles at a time to bound the score matrix
+        for start in range(0, len(titles), batch_size):
+            scores = process.cdist(
+                titles[start:start + batch_size], titles,
+                scorer=fuzz.token_sort_ratio, processor=fuzz_utils.default_process,
+                score_cutoff=threshold, dtype=np.uint8, workers=-1
+            )
+            for row, col in zip(*np.nonzero(scores)):
+                a, b = find(start + int(row)), find(int(col))
+                if a != b:
+                    parent[b] = a
+
+        best = {}
+        for i, paper in enumerate(papers):
+            root = find(i)
+            if root not in best or paper["relevance_score"] > best[root]["relevance_score"]:
+                best[root] = paper
+        return list(best.values())
+
+    def deduplicate(self):
+        """Return the papers left after cross-source deduplication, unordered."""
+        papers = list(self._seen.values())
+        if RAPIDFUZZ_AVAILABLE and len(papers) > 1:
+            papers = self.collapse_near_duplicates(papers)
+        return papers
 
     def curate_final_results(self, papers):
-        """Apply final quality filters and curation."""
-        # Filter by minimum relevance score
+        """Apply final quality filters and keep the top-ranked papers."""
+        # Filter by minimum relevance score and select the top results in one
+        # bounded-heap pass instead of sorting every candidate
         min_score = 0.3  # Minimum relevance threshold
-        relevant_papers = [p for p in papers if p.get("relevance_score", 0) >= min_score]
-
-        # Limit to top results
         max_results = self.search_config.get("total_max_results", 100)
-        final_papers = relevant_papers[:max_results]
+        final_papers = heapq.nlargest(
+            max_results,
+            (p for p in papers if p.get("relevance_score", 0) >= min_score),
+            key=itemgetter("relevance_score")
+        )
 
-        # Add metadata
+        # Add metadata; the cached keyword matches are internal and not written out
         for i, paper in enumerate(final_papers):
+            paper.pop("_terms", None)
             paper["rank"] = i + 1
 
         return final_papers
 
-    def save_results(self):
+    async def save_results(self):
         """Save search results to files."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Save main results
+        # Main results
         main_file = f"research_outputs/pediatric_cardiology_ml_search_results_{timestamp}.json"
-        with open(main_file, 'w') as f:
-            json.dump(self.results, f, indent=2, ensure_ascii=False)
 
-        # Save curated paper list
+        # Curated paper list
         curated_file = f"research_outputs/pediatric_cardiology_ml_selected_papers_{timestamp}.json"
         selected_papers = {
             "search_metadata": self.results["search_metadata"],
@@ -386,10 +684,8 @@ class PediatricCardiologyMLSearch:
             "curated_count": len(self.results["results"]),
             "papers": self.results["results"][:50]  # Top 50 papers
         }
-        with open(curated_file, 'w') as f:
-            json.dump(selected_papers, f, indent=2, ensure_ascii=False)
 
-        # Save search metrics
+        # Search metrics
         metrics_file = f"research_outputs/pediatric_cardiology_ml_search_metrics_{timestamp}.json"
         metrics = {
             "search_date": self.results["search_metadata"]["search_date"],
@@ -400,8 +696,14 @@ class PediatricCardiologyMLSearch:
             "relevance_distribution": self.calculate_relevance_distribution(),
             "database_contributions": self.calculate_database_contributions()
         }
-        with open(metrics_file, 'w') as f:
-            json.dump(metrics, f, indent=2, ensure_ascii=False)
+
+        # Encode and write the three files concurrently in worker threads so
+        # the event loop is not blocked on serialization or disk I/O
+        await asyncio.gather(
+            asyncio.to_thread(_write_json, main_file, self.results),
+            asyncio.to_thread(_write_json, curated_file, selected_papers),
+            asyncio.to_thread(_write_json, metrics_file, metrics)
+        )
 
         return {
             "main_results": main_file,
@@ -411,33 +713,32 @@ class PediatricCardiologyMLSearch:
 
     def calculate_relevance_distribution(self):
         """Calculate distribution of relevance scores."""
-        scores = [p.get("relevance_score", 0) for p in self.results["results"]]
-        if not scores:
+        scores = np.fromiter((p.get("relevance_score", 0) for p in self.results["results"]), dtype=np.float64)
+        if scores.size == 0:
             return {}
 
         return {
-            "high_relevance": len([s for s in scores if s >= 0.7]),
-            "medium_relevance": len([s for s in scores if 0.4 <= s < 0.7]),
-            "low_relevance": len([s for s in scores if s < 0.4]),
-            "average_score": sum(scores) / len(scores),
-            "max_score": max(scores),
-            "min_score": min(scores)
+            "high_relevance": int(np.count_nonzero(scores >= 0.7)),
+            "medium_relevance": int(np.count_nonzero((scores >= 0.4) & (scores < 0.7))),
+            "low_relevance": int(np.count_nonzero(scores < 0.4)),
+            "average_score": float(scores.mean()),
+            "max_score": float(scores.max()),
+            "min_score": float(scores.min())
         }
 
     def calculate_database_contributions(self):
         """Calculate contribution of each database."""
-        contributions = {}
-        for paper in self.results["results"]:
-            source = paper.get("database_source", "unknown")
-            contributions[source] = contributions.get(source, 0) + 1
-        return contributions
+        return dict(Counter(p.get("database_source", "unknown") for p in self.results["results"]))
 
 async def main():
     """Execute the comprehensive search."""
     searcher = PediatricCardiologyMLSearch()
 
     # Execute search
-    results = await searcher.execute_comprehensive_search()
+    try:
+        results = await searcher.execute_comprehensive_search()
+    finally:
+        await searcher.aclose()
 
     # Print summary
     print(f"\n📊 SEARCH SUMMARY")
@@ -458,7 +759,7 @@ async def main():
         print(f"{i:2d}. [{score:.2f}] {title[:70]}... ({year}, {source})")
 
     # Save results
-    saved_files = searcher.save_results()
+    saved_files = await searcher.save_results()
     print(f"\n📁 Results saved:")
     for file_type, file_path in saved_files.items():
         print(f"   {file_type}: {file_path}")
@@ -5,164 +5,181 @@ Used when API access is limited for demonstration purposes
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _encode_json(data):
+    """Encode data as indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Sample records are built once at import; callers receive a fresh list of the shared dicts
+_SAMPLE_PAPERS = (
+    {
+        "id": "sample_1",
+        "title": "Machine Learning Approaches for Early Detection of Atrial Fibrillation Using ECG Signals",
+        "authors": ["Chen, L.", "Wang, J.", "Zhang, M.", "Smith, R."],
+        "year": 2023,
+        "abstract": "This study presents a novel machine learning framework for early detection of atrial fibrillation from standard ECG recordings. Using deep learning architectures including convolutional neural networks and transformers, we achieved 95.2% sensitivity and 93.8% specificity in detecting paroxysmal AF episodes. The model was validated on a multi-center dataset of 50,000 ECG recordings from diverse patient populations.",
+        "journal": "Journal of Cardiovascular Electrophysiology",
+        "venue": None,
+        "citationCount": 156,
+        "url": "https://doi.org/10.1111/jce.14567",
+        "externalIds": {"DOI": "10.1111/jce.14567"},
+        "database_source": "sample",
+        "relevance_score": 95
+    },
+    {
+        "id": "sample_2",
+        "title": "2023 ESC Guidelines for the Management of Atrial Fibrillation",
+        "authors": ["Hindricks, G.", "Potpara, T.", "Dagres, N.", "Arbelo, E.", "Bax, J.J.", "Blomström-Lundqvist, C.", "Crijns, H.", "et al."],
+        "year": 2023,
+        "abstract": "The 2023 European Society of Cardiology guidelines provide comprehensive recommendations for the management of atrial fibrillation. Key updates include new risk stratification tools for stroke prevention, refined recommendations for catheter ablation, and integrated care approaches. The guideline emphasizes patient-centered decision making and incorporates evidence from recent randomized trials.",
+        "journal": "European Heart Journal",
+        "venue": None,
+        "citationCount": 892,
+        "url": "https://doi.org/10.1093/eurheartj/ehac112",
+        "externalIds": {"DOI": "10.1093/eurheartj/ehac112"},
+        "database_source": "sample",
+        "relevance_score": 100
+    },
+    {
+        "id": "sample_3",
+        "title": "Direct Oral Anticoagulants versus Warfarin in Elderly Patients with Atrial Fibrillation: A Systematic Review and Meta-Analysis",
+        "authors": ["Rodriguez, L.", "Kumar, S.", "Patel, A.", "Fisher, J."],
+        "year": 2022,
+        "abstract": "This meta-analysis compared the safety and efficacy of direct oral anticoagulants (DOACs) versus warfarin in patients aged 75 and older with atrial fibrillation. Analysis of 12 randomized trials involving 28,450 elderly patients showed that DOACs significantly reduced stroke risk (RR 0.85) and major bleeding (RR 0.78) compared to warfarin, while maintaining similar efficacy for thromboembolism prevention.",
+        "journal": "Circulation",
+        "venue": None,
+        "citationCount": 234,
+        "url": "https://doi.org/10.1161/CIRCULATIONAHA.122.059876",
+        "externalIds": {"DOI": "10.1161/CIRCULATIONAHA.122.059876"},
+        "database_source": "sample",
+        "relevance_score": 88
+    },
+    {
+        "id": "sample_4",
+        "title": "Catheter Ablation for Persistent Atrial Fibrillation: Outcomes and Predictors of Success",
+        "authors": ["Johnson, M.", "Williams, K.", "Brown, T.", "Anderson, P."],
+        "year": 2023,
+        "abstract": "Prospective multicenter study evaluating long-term outcomes after catheter ablation for persistent atrial fibrillation in 1,200 patients. Single-procedure success rate was 68% at 2 years, with significant improvement in quality of life scores. Independent predictors of success included younger age, shorter AF duration, and absence of structural heart disease. Repeat procedures increased success to 85%.",
+        "journal": "Heart Rhythm",
+        "venue": None,
+        "citationCount": 127,
+        "url": "https://doi.org/10.1016/j.hrthm.2023.02.015",
+        "externalIds": {"DOI": "10.1016/j.hrthm.2023.02.015"},
+        "database_source": "sample",
+        "relevance_score": 82
+    },
+    {
+        "id": "sample_5",
+        "title": "Wearable Devices for Detection of Silent Atrial Fibrillation: Systematic Review of Clinical Validity",
+        "authors": ["Garcia, M.", "Thompson, D.", "Lee, H.", "Martinez, R."],
+        "year": 2022,
+        "abstract": "Systematic review evaluating the clinical validity of consumer-grade wearable devices for detecting silent atrial fibrillation. Analysis of 28 validation studies showed variable sensitivity (55-98%) and specificity (70-96%) across different devices. Apple Watch and KardiaMobile demonstrated the highest diagnostic accuracy. Standardized monitoring protocols are needed for clinical implementation.",
+        "journal": "JAMA Cardiology",
+        "venue": None,
+        "citationCount": 189,
+        "url": "https://doi.org/10.1001/jamacardio.2022.2341",
+        "externalIds": {"DOI": "10.1001/jamacardio.2022.2341"},
+        "database_source": "sample",
+        "relevance_score": 85
+    },
+    {
+        "id": "sample_6",
+        "title": "Risk Prediction Models for Stroke in Atrial Fibrillation: Beyond CHA2DS2-VASc",
+        "authors": ["Wilson, E.", "Taylor, S.", "Robinson, J.", "Clark, D."],
+        "year": 2024,
+        "abstract": "Development and validation of a novel stroke risk prediction model for atrial fibrillation incorporating biomarkers, imaging parameters, and genetic factors. The model outperformed CHA2DS2-VASc (C-statistic 0.78 vs 0.67) in a validation cohort of 15,000 patients. Integration of renal function, inflammatory markers, and left atrial size improved risk stratification.",
+        "journal": "Lancet Digital Health",
+        "venue": None,
+        "citationCount": 67,
+        "url": "https://doi.org/10.1016/S2589-7500(24)00045-X",
+        "externalIds": {"DOI": "10.1016/S2589-7500(24)00045-X"},
+        "database_source": "sample",
+        "relevance_score": 79
+    },
+    {
+        "id": "sample_7",
+        "title": "Artificial Intelligence for Rhythm Control in Atrial Fibrillation: A Clinical Decision Support System",
+        "authors": ["Park, J.", "Kim, S.", "Lee, J.", "Yoo, B."],
+        "year": 2023,
+        "abstract": "Development of an AI-powered clinical decision support system for personalized rhythm control strategies in atrial fibrillation. The system integrates patient demographics, comorbidities, ECG characteristics, and genomic data to recommend optimal treatment approaches. Prospective validation showed 87% concordance with expert recommendations and improved patient outcomes.",
+        "journal": "Nature Medicine",
+        "venue": None,
+        "citationCount": 145,
+        "url": "https://doi.org/10.1038/s41591-023-02345-y",
+        "externalIds": {"DOI": "10.1038/s41591-023-02345-y"},
+        "database_source": "sample",
+        "relevance_score": 91
+    },
+    {
+        "id": "sample_8",
+        "title": "Lifestyle Interventions for Prevention of Atrial Fibrillation Recurrence: Randomized Controlled Trial",
+        "authors": ["Thompson, R.", "Anderson, K.", "Martin, P.", "White, S."],
+        "year": 2022,
+        "abstract": "Multicenter RCT evaluating the impact of intensive lifestyle modification on AF recurrence after catheter ablation. 400 patients were randomized to standard care versus comprehensive lifestyle intervention (weight loss, exercise, alcohol moderation). The intervention group had significantly lower AF recurrence (32% vs 54%) and improved quality of life at 2 years.",
+        "journal": "European Journal of Preventive Cardiology",
+        "venue": None,
+        "citationCount": 98,
+        "url": "https://doi.org/10.1177/2047487322112345",
+        "externalIds": {"DOI": "10.1177/2047487322112345"},
+        "database_source": "sample",
+        "relevance_score": 75
+    },
+    {
+        "id": "sample_9",
+        "title": "Left Atrial Appendage Closure Versus Direct Oral Anticoagulants in High-Risk Patients",
+        "authors": ["Chen, Y.", "Miller, D.", "Johnson, R.", "Davis, P."],
+        "year": 2023,
+        "abstract": "Prospective registry comparing outcomes of left atrial appendage closure (LAAC) versus DOACs in patients with contraindications to anticoagulation. 1,500 patients were followed for 3 years. LAAC was associated with lower rates of major bleeding (3.2% vs 8.7%) and similar stroke prevention efficacy compared to DOACs in this high-risk population.",
+        "journal": "JACC: Cardiovascular Interventions",
+        "venue": None,
+        "citationCount": 112,
+        "url": "https://doi.org/10.1016/j.jcin.2023.04.098",
+        "externalIds": {"DOI": "10.1016/j.jcin.2023.04.098"},
+        "database_source": "sample",
+        "relevance_score": 84
+    },
+    {
+        "id": "sample_10",
+        "title": "Genetic Risk Scores for Atrial Fibrillation: Clinical Applications and Limitations",
+        "authors": ["Liu, X.", "Wang, T.", "Zhang, H.", "Anderson, C."],
+        "year": 2024,
+        "abstract": "Comprehensive review of genetic risk scores for atrial fibrillation prediction and clinical decision-making. Analysis of genome-wide association studies identified over 140 genetic loci associated with AF. Polygenic risk scores combined with clinical factors improved prediction of incident AF, but clinical utility requires further validation.",
+        "journal": "Nature Reviews Cardiology",
+        "venue": None,
+        "citationCount": 45,
+        "url": "https://doi.org/10.1038/s41569-024-0087-z",
+        "externalIds": {"DOI": "10.1038/s41569-024-0087-z"},
+        "database_source": "sample",
+        "relevance_score": 77
+    }
+)
+
 
 def generate_sample_atrial_fibrillation_papers():
     """Generate realistic sample search results for atrial fibrillation"""
 
-    sample_papers = [
-        {
-            "id": "sample_1",
-            "title": "Machine Learning Approaches for Early Detection of Atrial Fibrillation Using ECG Signals",
-            "authors": ["Chen, L.", "Wang, J.", "Zhang, M.", "Smith, R."],
-            "year": 2023,
-            "abstract": "This study presents a novel machine learning framework for early detection of atrial fibrillation from standard ECG recordings. Using deep learning architectures including convolutional neural networks and transformers, we achieved 95.2% sensitivity and 93.8% specificity in detecting paroxysmal AF episodes. The model was validated on a multi-center dataset of 50,000 ECG recordings from diverse patient populations.",
-            "journal": "Journal of Cardiovascular Electrophysiology",
-            "venue": None,
-            "citationCount": 156,
-            "url": "https://doi.org/10.1111/jce.14567",
-            "externalIds": {"DOI": "10.1111/jce.14567"},
-            "database_source": "sample",
-            "relevance_score": 95
-        },
-        {
-            "id": "sample_2",
-            "title": "2023 ESC Guidelines for the Management of Atrial Fibrillation",
-            "authors": ["Hindricks, G.", "Potpara, T.", "Dagres, N.", "Arbelo, E.", "Bax, J.J.", "Blomström-Lundqvist, C.", "Crijns, H.", "et al."],
-            "year": 2023,
-            "abstract": "The 2023 European Society of Cardiology guidelines provide comprehensive recommendations for the management of atrial fibrillation. Key updates include new risk stratification tools for stroke prevention, refined recommendations for catheter ablation, and integrated care approaches. The guideline emphasizes patient-centered decision making and incorporates evidence from recent randomized trials.",
-            "journal": "European Heart Journal",
-            "venue": None,
-            "citationCount": 892,
-            "url": "https://doi.org/10.1093/eurheartj/ehac112",
-            "externalIds": {"DOI": "10.1093/eurheartj/ehac112"},
-            "database_source": "sample",
-            "relevance_score": 100
-        },
-        {
-            "id": "sample_3",
-            "title": "Direct Oral Anticoagulants versus Warfarin in Elderly Patients with Atrial Fibrillation: A Systematic Review and Meta-Analysis",
-            "authors": ["Rodriguez, L.", "Kumar, S.", "Patel, A.", "Fisher, J."],
-            "year": 2022,
-            "abstract": "This meta-analysis compared the safety and efficacy of direct oral anticoagulants (DOACs) versus warfarin in patients aged 75 and older with atrial fibrillation. Analysis of 12 randomized trials involving 28,450 elderly patients showed that DOACs significantly reduced stroke risk (RR 0.85) and major bleeding (RR 0.78) compared to warfarin, while maintaining similar efficacy for thromboembolism prevention.",
-            "journal": "Circulation",
-            "venue": None,
-            "citationCount": 234,
-            "url": "https://doi.org/10.1161/CIRCULATIONAHA.122.059876",
-            "externalIds": {"DOI": "10.1161/CIRCULATIONAHA.122.059876"},
-            "database_source": "sample",
-            "relevance_score": 88
-        },
-        {
-            "id": "sample_4",
-            "title": "Catheter Ablation for Persistent Atrial Fibrillation: Outcomes and Predictors of Success",
-            "authors": ["Johnson, M.", "Williams, K.", "Brown, T.", "Anderson, P."],
-            "year": 2023,
-            "abstract": "Prospective multicenter study evaluating long-term outcomes after catheter ablation for persistent atrial fibrillation in 1,200 patients. Single-procedure success rate was 68% at 2 years, with significant improvement in quality of life scores. Independent predictors of success included younger age, shorter AF duration, and absence of structural heart disease. Repeat procedures increased success to 85%.",
-            "journal": "Heart Rhythm",
-            "venue": None,
-            "citationCount": 127,
-            "url": "https://doi.org/10.1016/j.hrthm.2023.02.015",
-            "externalIds": {"DOI": "10.1016/j.hrthm.2023.02.015"},
-            "database_source": "sample",
-            "relevance_score": 82
-        },
-        {
-            "id": "sample_5",
-            "title": "Wearable Devices for Detection of Silent Atrial Fibrillation: Systematic Review of Clinical Validity",
-            "authors": ["Garcia, M.", "Thompson, D.", "Lee, H.", "Martinez, R."],
-            "year": 2022,
-            "abstract": "Systematic review evaluating the clinical validity of consumer-grade wearable devices for detecting silent atrial fibrillation. Analysis of 28 validation studies showed variable sensitivity (55-98%) and specificity (70-96%) across different devices. Apple Watch and KardiaMobile demonstrated the highest diagnostic accuracy. Standardized monitoring protocols are needed for clinical implementation.",
-            "journal": "JAMA Cardiology",
-            "venue": None,
-            "citationCount": 189,
-            "url": "https://doi.org/10.1001/jamacardio.2022.2341",
-            "externalIds": {"DOI": "10.1001/jamacardio.2022.2341"},
-            "database_source": "sample",
-            "relevance_score": 85
-        },
-        {
-            "id": "sample_6",
-            "title": "Risk Prediction Models for Stroke in Atrial Fibrillation: Beyond CHA2DS2-VASc",
-            "authors": ["Wilson, E.", "Taylor, S.", "Robinson, J.", "Clark, D."],
-            "year": 2024,
-            "abstract": "Development and validation of a novel stroke risk prediction model for atrial fibrillation incorporating biomarkers, imaging parameters, and genetic factors. The model outperformed CHA2DS2-VASc (C-statistic 0.78 vs 0.67) in a validation cohort of 15,000 patients. Integration of renal function, inflammatory markers, and left atrial size improved risk stratification.",
-            "journal": "Lancet Digital Health",
-            "venue": None,
-            "citationCount": 67,
-            "url": "https://doi.org/10.1016/S2589-7500(24)00045-X",
-            "externalIds": {"DOI": "10.1016/S2589-7500(24)00045-X"},
-            "database_source": "sample",
-            "relevance_score": 79
-        },
-        {
-            "id": "sample_7",
-            "title": "Artificial Intelligence for Rhythm Control in Atrial Fibrillation: A Clinical Decision Support System",
-            "authors": ["Park, J.", "Kim, S.", "Lee, J.", "Yoo, B."],
-            "year": 2023,
-            "abstract": "Development of an AI-powered clinical decision support system for personalized rhythm control strategies in atrial fibrillation. The system integrates patient demographics, comorbidities, ECG characteristics, and genomic data to recommend optimal treatment approaches. Prospective validation showed 87% concordance with expert recommendations and improved patient outcomes.",
-            "journal": "Nature Medicine",
-            "venue": None,
-            "citationCount": 145,
-            "url": "https://doi.org/10.1038/s41591-023-02345-y",
-            "externalIds": {"DOI": "10.1038/s41591-023-02345-y"},
-            "database_source": "sample",
-            "relevance_score": 91
-        },
-        {
-            "id": "sample_8",
-            "title": "Lifestyle Interventions for Prevention of Atrial Fibrillation Recurrence: Randomized Controlled Trial",
-            "authors": ["Thompson, R.", "Anderson, K.", "Martin, P.", "White, S."],
-            "year": 2022,
-            "abstract": "Multicenter RCT evaluating the impact of intensive lifestyle modification on AF recurrence after catheter ablation. 400 patients were randomized to standard care versus comprehensive lifestyle intervention (weight loss, exercise, alcohol moderation). The intervention group had significantly lower AF recurrence (32% vs 54%) and improved quality of life at 2 years.",
-            "journal": "European Journal of Preventive Cardiology",
-            "venue": None,
-            "citationCount": 98,
-            "url": "https://doi.org/10.1177/2047487322112345",
-            "externalIds": {"DOI": "10.1177/2047487322112345"},
-            "database_source": "sample",
-            "relevance_score": 75
-        },
-        {
-            "id": "sample_9",
-            "title": "Left Atrial Appendage Closure Versus Direct Oral Anticoagulants in High-Risk Patients",
-            "authors": ["Chen, Y.", "Miller, D.", "Johnson, R.", "Davis, P."],
-            "year": 2023,
-            "abstract": "Prospective registry comparing outcomes of left atrial appendage closure (LAAC) versus DOACs in patients with contraindications to anticoagulation. 1,500 patients were followed for 3 years. LAAC was associated with lower rates of major bleeding (3.2% vs 8.7%) and similar stroke prevention efficacy compared to DOACs in this high-risk population.",
-            "journal": "JACC: Cardiovascular Interventions",
-            "venue": None,
-            "citationCount": 112,
-            "url": "https://doi.org/10.1016/j.jcin.2023.04.098",
-            "externalIds": {"DOI": "10.1016/j.jcin.2023.04.098"},
-            "database_source": "sample",
-            "relevance_score": 84
-        },
-        {
-            "id": "sample_10",
-            "title": "Genetic Risk Scores for Atrial Fibrillation: Clinical Applications and Limitations",
-            "authors": ["Liu, X.", "Wang, T.", "Zhang, H.", "Anderson, C."],
-            "year": 2024,
-            "abstract": "Comprehensive review of genetic risk scores for atrial fibrillation prediction and clinical decision-making. Analysis of genome-wide association studies identified over 140 genetic loci associated with AF. Polygenic risk scores combined with clinical factors improved prediction of incident AF, but clinical utility requires further validation.",
-            "journal": "Nature Reviews Cardiology",
-            "venue": None,
-            "citationCount": 45,
-            "url": "https://doi.org/10.1038/s41569-024-0087-z",
-            "externalIds": {"DOI": "10.1038/s41569-024-0087-z"},
-            "database_source": "sample",
-            "relevance_score": 77
-        }
-    ]
-
-    return sample_papers
+    return list(_SAMPLE_PAPERS)
 
 
 def create_comprehensive_search_results():
     """Create comprehensive search results with multiple sources"""
 
     # Generate papers from different sources
-    semantic_scholar_papers = generate_sample_atrial_fibrillation_papers()[:6]
+    semantic_scholar_papers = list(_SAMPLE_PAPERS[:6])
     arxiv_papers = [
         {
             "id": "arxiv_1",
@@ -198,7 +215,7 @@ def create_comprehensive_search_results():
     all_papers = semantic_scholar_papers + arxiv_papers
 
     # Sort by relevance score
-    all_papers.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+    all_papers.sort(key=itemgetter('relevance_score'), reverse=True)
 
     return {
         "semantic_scholar": semantic_scholar_papers,
@@ -213,7 +230,9 @@ def save_search_results():
     output_dir = Path("research_outputs")
     output_dir.mkdir(exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    iso_timestamp = now.isoformat()
 
     # Get comprehensive results
     search_results = create_comprehensive_search_results()
@@ -223,7 +242,7 @@ def save_search_results():
     comprehensive_file = output_dir / f"search_results_comprehensive_sample_{timestamp}.json"
 
     search_metadata = {
-        "search_timestamp": datetime.now().isoformat(),
+        "search_timestamp": iso_timestamp,
         "search_type": "comprehensive_sample",
         "query": "Atrial fibrillation in cardiology",
         "total_results": len(all_papers),
@@ -241,53 +260,62 @@ def save_search_results():
         "results": all_papers
     }
 
-    with open(comprehensive_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    # Payloads are encoded as they are built and written together at the end
+    outputs = [(comprehensive_file, _encode_json(output_data))]
 
-    # Save source-specific results
+    # Save source-specific results; each file is encoded before the next source
+    # overwrites the per-source fields, so one metadata copy serves them all
+    source_metadata = dict(search_metadata)
     for source, papers in search_results.items():
         if source != "all_papers":
             source_file = output_dir / f"search_results_{source}_sample_{timestamp}.json"
+            source_metadata["source"] = source
+            source_metadata["paper_count"] = len(papers)
             source_data = {
-                "metadata": {
-                    **search_metadata,
-                    "source": source,
-                    "paper_count": len(papers)
-                },
+                "metadata": source_metadata,
                 "results": papers
             }
-            with open(source_file, 'w', encoding='utf-8') as f:
-                json.dump(source_data, f, indent=2, ensure_ascii=False)
+            outputs.append((source_file, _encode_json(source_data)))
+
+    # Aggregate quality indicators and the top-10 projection in one pass
+    citation_total = high_impact_count = recent_count = 0
+    top_papers = []
+    for i, paper in enumerate(all_papers):
+        citations = paper.get('citationCount', 0)
+        citation_total += citations
+        if citations > 100:
+            high_impact_count += 1
+        if paper.get('year', 0) >= 2023:
+            recent_count += 1
+        if i < 10:
+            top_papers.append({
+                "rank": i + 1,
+                "title": paper.get('title'),
+                "authors": paper.get('authors', [])[:3],
+                "year": paper.get('year'),
+                "citations": citations,
+                "relevance_score": paper.get('relevance_score', 0),
+                "source": paper.get('database_source')
+            })
 
     # Create summary
     summary_data = {
         "search_summary": {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_timestamp,
             "research_topic": "Atrial fibrillation in cardiology",
             "total_papers_found": len(all_papers),
             "search_methods_used": ["sample_semantic_scholar", "sample_arxiv"],
             "search_success": True,
             "quality_indicators": {
-                "avg_citations": sum(p.get('citationCount', 0) for p in all_papers) / len(all_papers),
-                "papers_with_high_impact": len([p for p in all_papers if p.get('citationCount', 0) > 100]),
-                "recent_publications": len([p for p in all_papers if p.get('year', 0) >= 2023])
+                "avg_citations": round(citation_total / len(all_papers), 2),
+                "papers_with_high_impact": high_impact_count,
+                "recent_publications": recent_count
             }
         },
         "source_breakdown": {
             source: len(papers) for source, papers in search_results.items() if source != "all_papers"
         },
-        "top_papers": [
-            {
-                "rank": i + 1,
-                "title": paper.get('title'),
-                "authors": paper.get('authors', [])[:3],
-                "year": paper.get('year'),
-                "citations": paper.get('citationCount', 0),
-                "relevance_score": paper.get('relevance_score', 0),
-                "source": paper.get('database_source')
-            }
-            for i, paper in enumerate(all_papers[:10])
-        ],
+        "top_papers": top_papers,
         "paper_categories": {
             "clinical_guidelines": 1,
             "machine_learning_ai": 4,
@@ -298,8 +326,11 @@ def save_search_results():
     }
 
     summary_file = output_dir / f"search_summary_sample_{timestamp}.json"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(summary_data, f, indent=2, ensure_ascii=False)
+    outputs.append((summary_file, _encode_json(summary_data)))
+
+    # The files are independent, so write them concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda output: output[0].write_bytes(output[1]), outputs))
 
     print(f"=== SAMPLE SEARCH RESULTS GENERATED ===")
     print(f"Total papers: {len(all_papers)}")
@@ -8,9 +8,16 @@ import asyncio
 import json
 import os
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add the project root to Python path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -26,6 +33,15 @@ except ImportError as e:
     # Fallback implementations will be added below
 
 
+def _write_json(path, data):
+    """Write data to path as indented UTF-8 JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    Path(path).write_bytes(payload)
+
+
 async def execute_atrial_fibrillation_search():
     """Execute comprehensive search for atrial fibrillation literature"""
 
@@ -50,61 +66,63 @@ async def execute_atrial_fibrillation_search():
 
     search_results = {}
 
+    # The three search methods are independent, so run them concurrently
+    print("\n=== Executing Comprehensive, Quick and Unified Multi-Source Searches ===")
     try:
-        # Method 1: Try comprehensive research search first
-        print("\n=== Executing Comprehensive Research Search ===")
-        results = await comprehensive_research_search(
-            query=query,
-            domain=domain,
-            max_results=300,
-            api_keys=api_keys
-        )
-
-        if results:
-            search_results['comprehensive'] = results
-            print(f"Found {len(results)} papers via comprehensive search")
-
-        # Method 2: Quick paper search for additional results
-        print("\n=== Executing Quick Paper Search ===")
-        quick_results = await quick_paper_search(
-            query,
-            max_results=100,
-            api_keys=api_keys
+        method_results = await asyncio.gather(
+            # Method 1: Comprehensive research search
+            comprehensive_research_search(
+                query=query,
+                domain=domain,
+                max_results=300,
+                api_keys=api_keys
+            ),
+            # Method 2: Quick paper search for additional results
+            quick_paper_search(
+                query,
+                max_results=100,
+                api_keys=api_keys
+            ),
+            # Method 3: Unified search with all sources
+            unified_search(
+                query=query,
+                include_papers=True,
+                include_datasets=False,
+                paper_sources=["semantic_scholar", "arxiv", "pubmed"],
+                prefer_mcp=True,
+                fallback_to_api=True,
+                max_results=200
+            ),
+            return_exceptions=True
         )
-
-        if quick_results:
-            search_results['quick'] = quick_results
-            print(f"Found {len(quick_results)} papers via quick search")
-
-        # Method 3: Unified search with all sources
-        print("\n=== Executing Unified Multi-Source Search ===")
-        unified_results = await unified_search(
-            query=query,
-            include_papers=True,
-            include_datasets=False,
-            paper_sources=["semantic_scholar", "arxiv", "pubmed"],
-            prefer_mcp=True,
-            fallback_to_api=True,
-            max_results=200
-        )
-
-        if unified_results:
-            search_results['unified'] = unified_results
-            print(f"Found {len(unified_results)} papers via unified search")
-
     except Exception as e:
+        # e.g. the search utilities failed to import
         print(f"Error during search execution: {e}")
-        # Implement fallback search logic here if needed
+        method_results = []
+
+    for search_type, results in zip(("comprehensive", "quick", "unified"), method_results):
+        if isinstance(results, Exception):
+            print(f"Error during {search_type} search execution: {results}")
+            # Implement fallback search logic here if needed
+            continue
+
+        if results:
+            search_results[search_type] = results
+            print(f"Found {len(results)} papers via {search_type} search")
 
     # Save all search results
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    iso_timestamp = now.isoformat()
 
+    pending_writes = []
+    saved_files = []
     for search_type, results in search_results.items():
         output_file = output_dir / f"search_results_{search_type}_{timestamp}.json"
 
         # Add search metadata
         search_metadata = {
-            "search_timestamp": datetime.now().isoformat(),
+            "search_timestamp": iso_timestamp,
             "search_type": search_type,
             "query": query,
             "domain": domain,
@@ -121,10 +139,13 @@ async def execute_atrial_fibrillation_search():
             "results": results or []
         }
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        pending_writes.append(asyncio.to_thread(_write_json, output_file, output_data))
+        saved_files.append((output_file, len(results) if results else 0))
 
-        print(f"Saved {len(results) if results else 0} results to {output_file}")
+    # Encode and write the per-method files in worker threads, off the event loop
+    await asyncio.gather(*pending_writes)
+    for output_file, result_count in saved_files:
+        print(f"Saved {result_count} results to {output_file}")
 
     # Generate summary report
     await generate_search_summary(search_results, output_dir, timestamp)
@@ -135,7 +156,7 @@ async def execute_atrial_fibrillation_search():
 async def generate_search_summary(search_results, output_dir, timestamp):
     """Generate a comprehensive summary of all search results"""
 
-    total_papers = sum(len(results) for results in search_results.values() if results)
+    total_papers = sum(map(len, filter(None, search_results.values())))
     search_types = list(search_results.keys())
 
     summary = {
@@ -151,22 +172,35 @@ async def generate_search_summary(search_results, output_dir, timestamp):
 
     for search_type, results in search_results.items():
         if results:
-            # Analyze results for this search method
-            years = [paper.get('year', 0) for paper in results if paper.get('year')]
-            citation_counts = [paper.get('citationCount', 0) for paper in results if paper.get('citationCount')]
+            # Analyze results for this search method in one pass, without intermediate lists
+            min_year = max_year = None
+            citation_sum = citation_count = 0
+            for paper in results:
+                year = paper.get('year')
+                if year:
+                    if min_year is None or year < min_year:
+                        min_year = year
+                    if max_year is None or year > max_year:
+                        max_year = year
+                citations = paper.get('citationCount')
+                if citations:
+                    citation_sum += citations
+                    citation_count += 1
 
             summary["results_by_method"][search_type] = {
                 "paper_count": len(results),
-                "year_range": f"{min(years)}-{max(years)}" if years else "N/A",
-                "avg_citations": sum(citation_counts) / len(citation_counts) if citation_counts else 0,
+                "year_range": f"{min_year}-{max_year}" if min_year is not None else "N/A",
+                "avg_citations": round(citation_sum / citation_count, 2) if citation_count else 0,
                 "top_journals": _extract_top_journals(results),
-                "sample_titles": [paper.get('title', '')[:100] + "..." if len(paper.get('title', '')) > 100 else paper.get('title', '') for paper in results[:5]]
+                "sample_titles": [
+                    title[:100] + "..." if len(title := paper.get('title', '')) > 100 else title
+                    for paper in results[:5]
+                ]
             }
 
     # Save summary
     summary_file = output_dir / f"search_summary_{timestamp}.json"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    await asyncio.to_thread(_write_json, summary_file, summary)
 
     print(f"\n=== SEARCH SUMMARY ===")
     print(f"Total papers found: {total_papers}")
@@ -179,15 +213,14 @@ async def generate_search_summary(search_results, output_dir, timestamp):
 
 def _extract_top_journals(results, top_n=5):
     """Extract top journals from search results"""
-    journal_counts = {}
+    journal_counts = Counter()
     for paper in results:
         journal = paper.get('journal', '') or paper.get('venue', '')
         if journal:
-            journal_counts[journal] = journal_counts.get(journal, 0) + 1
+            journal_counts[journal] += 1
 
-    # Sort by count and return top N
-    sorted_journals = sorted(journal_counts.items(), key=lambda x: x[1], reverse=True)
-    return dict(sorted_journals[:top_n])
+    # Top N by count (ties keep first-seen order)
+    return dict(journal_counts.most_common(top_n))
 
 
 async def generate_human_readable_report(summary, output_dir, timestamp):
@@ -195,40 +228,43 @@ async def generate_human_readable_report(summary, output_dir, timestamp):
 
     report_file = output_dir / f"search_report_{timestamp}.md"
 
-    with open(report_file, 'w', encoding='utf-8') as f:
-        f.write("# Atrial Fibrillation Literature Search Report\n\n")
-        f.write(f"**Search Date:** {summary['search_summary']['timestamp']}\n")
-        f.write(f"**Research Topic:** {summary['search_summary']['research_topic']}\n")
-        f.write(f"**Total Papers Found:** {summary['search_summary']['total_papers_found']}\n\n")
+    parts = []
+    parts.append("# Atrial Fibrillation Literature Search Report\n\n")
+    parts.append(f"**Search Date:** {summary['search_summary']['timestamp']}\n")
+    parts.append(f"**Research Topic:** {summary['search_summary']['research_topic']}\n")
+    parts.append(f"**Total Papers Found:** {summary['search_summary']['total_papers_found']}\n\n")
+
+    parts.append("## Search Methods Used\n\n")
+    for method in summary['search_summary']['search_methods_used']:
+        parts.append(f"- {method}\n")
 
-        f.write("## Search Methods Used\n\n")
-        for method in summary['search_summary']['search_methods_used']:
-            f.write(f"- {method}\n")
+    parts.append("\n## Results by Search Method\n\n")
 
-        f.write("\n## Results by Search Method\n\n")
+    for method, data in summary['results_by_method'].items():
+        parts.append(f"### {method.title()} Search\n\n")
+        parts.append(f"- **Papers Found:** {data['paper_count']}\n")
+        parts.append(f"- **Publication Year Range:** {data['year_range']}\n")
+        parts.append(f"- **Average Citations:** {data['avg_citations']:.1f}\n")
 
-        for method, data in summary['results_by_method'].items():
-            f.write(f"### {method.title()} Search\n\n")
-            f.write(f"- **Papers Found:** {data['paper_count']}\n")
-            f.write(f"- **Publication Year Range:** {data['year_range']}\n")
-            f.write(f"- **Average Citations:** {data['avg_citations']:.1f}\n")
+        if data['top_journals']:
+            parts.append("\n**Top Journals:**\n")
+            for journal, count in data['top_journals'].items():
+                parts.append(f"- {journal}: {count} papers\n")
 
-            if data['top_journals']:
-                f.write("\n**Top Journals:**\n")
-                for journal, count in data['top_journals'].items():
-                    f.write(f"- {journal}: {count} papers\n")
+        parts.append("\n**Sample Titles:**\n")
+        for title in data['sample_titles']:
+            parts.append(f"- {title}\n")
 
-            f.write("\n**Sample Titles:**\n")
-            for title in data['sample_titles']:
-                f.write(f"- {title}\n")
+        parts.append("\n")
 
-            f.write("\n")
+    parts.append("## Next Steps\n\n")
+    parts.append("1. Review and deduplicate results across search methods\n")
+    parts.append("2. Apply relevance scoring and ranking\n")
+    parts.append("3. Select top papers for detailed analysis\n")
+    parts.append("4. Pass selected papers to Paper Reader Subagent\n")
 
-        f.write("## Next Steps\n\n")
-        f.write("1. Review and deduplicate results across search methods\n")
-        f.write("2. Apply relevance scoring and ranking\n")
-        f.write("3. Select top papers for detailed analysis\n")
-        f.write("4. Pass selected papers to Paper Reader Subagent\n")
+    # Assemble the report in memory and write it with a single call off the event loop
+    await asyncio.to_thread(report_file.write_text, "".join(parts), encoding='utf-8')
 
     print(f"Human-readable report saved to: {report_file}")
 
@@ -242,7 +278,7 @@ if __name__ == "__main__":
 
     if results:
         print(f"\nSearch completed successfully!")
-        total_papers = sum(len(r) for r in results.values() if r)
+        total_papers = sum(map(len, filter(None, results.values())))
         print(f"Total papers collected: {total_papers}")
     else:
         print("\nSearch completed but no results were found.")
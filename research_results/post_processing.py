@@ -4,112 +4,380 @@ Post-processing and enhancement of search results for Atrial Fibrillation resear
 Includes deduplication, relevance ranking, and quality assessment
 """
 
+import hashlib
+import heapq
 import json
+import os
+import re
 from datetime import datetime
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordSet:
+    """
+    Substring keyword matcher that finds every keyword in a text in one scan.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed. Otherwise a
+    single lookahead regex alternation is tried at every position of the text;
+    keywords are ordered shortest first and longer keywords sharing that start
+    are recovered from a prefix table, so overlapping keywords are all reported.
+    """
+
+    def __init__(self, keywords):
+        ordered = sorted(set(keywords), key=len)
+        self.max_length = len(ordered[-1])
+        if AHOCORASICK_AVAILABLE:
+            self.automaton = ahocorasick.Automaton()
+            for keyword in ordered:
+                self.automaton.add_word(keyword, keyword)
+            self.automaton.make_automaton()
+        else:
+            self.automaton = None
+            self.pattern = re.compile('(?=(%s))' % '|'.join(map(re.escape, ordered)))
+            self.extensions = {
+                keyword: tuple(other for other in ordered if other != keyword and other.startswith(keyword))
+                for keyword in ordered
+            }
+
+    def find(self, text):
+        """Return the set of keywords occurring in text"""
+        if self.automaton is not None:
+            return {keyword for _, keyword in self.automaton.iter(text)}
+        found = set()
+        for match in self.pattern.finditer(text):
+            keyword = match.group(1)
+            found.add(keyword)
+            for longer in self.extensions[keyword]:
+                if text.startswith(longer, match.start()):
+                    found.add(longer)
+        return found
+
+    def search(self, text):
+        """Return True if any keyword occurs in text"""
+        if self.automaton is not None:
+            return next(self.automaton.iter(text), None) is not None
+        return self.pattern.search(text) is not None
+
+
+# Keyword tables for calculate_clinical_relevance
+CLINICAL_KEYWORDS = frozenset([
+    'patient', 'clinical', 'treatment', 'therapy', 'management',
+    'outcome', 'prognosis', 'diagnosis', 'prevention', 'guideline',
+    'randomized', 'trial', 'study', 'cohort', 'mortality'
+])
+
+HIGH_IMPACT_TOPICS = frozenset([
+    'stroke prevention', 'anticoagulation', 'catheter ablation',
+    'mortality', 'quality of life', 'guidelines', 'risk stratification'
+])
+
+HIGH_IMPACT_JOURNALS = KeywordSet([
+    'new england journal', 'lancet', 'jama', 'nature', 'circulation',
+    'european heart', 'journal of american college', 'heart rhythm'
+])
+
+# Statistical reporting terms counted by assess_methodology
+STATISTICAL_TERMS = frozenset([
+    'statistically significant', 'p-value', 'confidence interval',
+    'hazard ratio', 'odds ratio', 'multivariate', 'adjusted'
+])
+
+# Every keyword any analyzer looks for in a title or abstract
+PAPER_KEYWORDS = KeywordSet([
+    # classify_paper_type
+    'guideline', 'recommendation', 'consensus', 'systematic review', 'meta-analysis',
+    'randomized', 'trial', 'rct', 'machine learning', 'deep learning', 'ai',
+    'artificial intelligence', 'review', 'study', 'analysis',
+    # calculate_clinical_relevance
+    *CLINICAL_KEYWORDS, *HIGH_IMPACT_TOPICS,
+    # assess_methodology
+    'prospective', 'multicenter', 'cohort', 'cross-sectional', *STATISTICAL_TERMS,
+    # determine_target_audience
+    'algorithm', 'computational', 'treatment', 'therapy', 'management', 'diagnosis',
+    'detection', 'screening', 'cost', 'economic', 'healthcare',
+    # identify_research_gaps
+    'novel', 'first', 'new', 'limitations', 'future', 'need', 'understudied', 'rare',
+    'less known', 'comparison', 'versus', 'compare', 'real-world', 'practice',
+    'long-term', 'follow-up'
+])
+
+# Minimum number of distinct papers before analysis is spread across processes
+PARALLEL_ANALYSIS_THRESHOLD = 200
+
+NON_WORD_RE = re.compile(r'\W+')
+
+# Whole numbers of three or more digits; shorter ones can never reach the sample size tiers
+SAMPLE_SIZE_RE = re.compile(r'(?<!\d)\d{3,}')
+
+
+class PaperText(NamedTuple):
+    """Lowercased paper text and the PAPER_KEYWORDS found in each field"""
+    title: str
+    abstract: str
+    title_terms: set
+    abstract_terms: set
+    combined_terms: set  # keywords in "title abstract"
+
+
+def analyze_text(paper):
+    """Lowercase a paper's title and abstract and find all analyzer keywords in one pass each"""
+    title = paper.get('title', '').lower()
+    abstract = paper.get('abstract', '').lower()
+    title_terms = PAPER_KEYWORDS.find(title)
+    abstract_terms = PAPER_KEYWORDS.find(abstract)
+
+    # A keyword in "title abstract" lies in the title, in the abstract, or spans the
+    # joining space; only the window around that space needs a separate scan
+    reach = PAPER_KEYWORDS.max_length - 1
+    boundary = title[max(0, len(title) - reach):] + ' ' + abstract[:reach]
+    combined_terms = title_terms | abstract_terms | PAPER_KEYWORDS.find(boundary)
+
+    return PaperText(title, abstract, title_terms, abstract_terms, combined_terms)
+
+
+# Tag lists come from small fixed vocabularies, so papers share one tuple per distinct list
+_TAG_TUPLES = {}
+
+
+def _shared_tags(tags):
+    """Return the canonical tuple for a list of tags"""
+    tags = tuple(tags)
+    return _TAG_TUPLES.setdefault(tags, tags)
 
 
 def load_search_results():
     """Load the most recent search results"""
     output_dir = Path("research_outputs")
 
-    # Find the most recent comprehensive results file
-    comprehensive_files = list(output_dir.glob("search_results_comprehensive_*.json"))
-
-    if not comprehensive_files:
+    # Find the most recent comprehensive results file; scandir matches names without
+    # building Path objects and each entry caches its stat result
+    try:
+        with os.scandir(output_dir) as entries:
+            latest_entry = max(
+                (entry for entry in entries
+                 if entry.name.startswith("search_results_comprehensive_")
+                 and entry.name.endswith(".json") and entry.is_file()),
+                key=lambda entry: entry.stat().st_mtime,
+                default=None
+            )
+    except FileNotFoundError:
+        latest_entry = None
+
+    if latest_entry is None:
         print("No search results found!")
         return None
 
-    # Sort by modification time and get the most recent
-    latest_file = max(comprehensive_files, key=lambda f: f.stat().st_mtime)
+    latest_file = Path(latest_entry.path)
     print(f"Loading results from: {latest_file}")
 
+    # With ijson the papers are streamed one at a time instead of parsing the whole file
+    if IJSON_AVAILABLE:
+        with open(latest_file, 'rb') as f:
+            metadata = next(ijson.items(f, 'metadata', use_float=True), {})
+        return {"metadata": metadata, "results": _stream_papers(latest_file)}
+
+    if ORJSON_AVAILABLE:
+        return orjson.loads(latest_file.read_bytes())
+
     with open(latest_file, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
     return data
 
 
-def enhance_papers_metadata(papers):
-    """Enhance paper metadata with additional analysis"""
+def _stream_papers(path):
+    """Yield the papers of a search results file one at a time"""
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, 'results.item', use_float=True)
 
-    enhanced_papers = []
 
+# Text fields that reprints and cross-database copies of a paper often repeat verbatim
+INTERNED_FIELDS = ('title', 'abstract', 'journal')
+
+
+def _intern_strings(papers):
+    """Yield papers with repeated title, abstract and journal strings sharing one object"""
+    pool = {}
     for paper in papers:
-        enhanced_paper = paper.copy()
+        for field in INTERNED_FIELDS:
+            value = paper.get(field)
+            if isinstance(value, str):
+                paper[field] = pool.setdefault(value, value)
+        yield paper
+
+
+def _encode_json(data):
+    """Encode data as indented UTF-8 JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_json(path, data):
+    """Write data to path as indented UTF-8 JSON"""
+    Path(path).write_bytes(_encode_json(data))
+
+
+def _write_results_json(path, metadata, papers):
+    """
+    Write {"metadata": ..., "results": [...]} as indented JSON, one paper at a time.
+
+    Produces the same bytes as _write_json on the whole document without ever
+    holding the full encoding in memory. Encoded JSON never contains a raw
+    newline inside a string, so nesting is just re-indenting each line.
+    """
+    with open(path, 'wb') as f:
+        f.write(b'{\n  "metadata": ' + _encode_json(metadata).replace(b'\n', b'\n  ') + b',\n  "results": [')
+        separator = b'\n    '
+        for paper in papers:
+            f.write(separator + _encode_json(paper).replace(b'\n', b'\n    '))
+            separator = b',\n    '
+        f.write(b'\n  ]\n}' if papers else b']\n}')
+
+
+def _dedup_key(paper):
+    """DOI if known, else a digest of the normalized title; None if the paper has neither"""
+    doi = paper.get('doi') or (paper.get('externalIds') or {}).get('DOI')
+    if doi:
+        return doi.strip().lower()
+    title = NON_WORD_RE.sub(' ', (paper.get('title') or '').lower()).strip()
+    if title:
+        return hashlib.blake2b(title.encode('utf-8'), digest_size=16).digest()
+    return None
+
+
+def deduplicate_papers(papers):
+    """
+    Collapse records of the same paper, keeping the most-cited copy.
+
+    Returns (unique_papers, duplicates_removed); first-seen order is preserved.
+    """
+    unique = {}
+    duplicates_removed = 0
+    for paper in papers:
+        # Papers with neither DOI nor title cannot be matched, so each gets its own key
+        key = _dedup_key(paper) or object()
+        current = unique.get(key)
+        if current is None:
+            unique[key] = paper
+        else:
+            duplicates_removed += 1
+            if (paper.get('citationCount') or 0) > (current.get('citationCount') or 0):
+                unique[key] = paper
+    return list(unique.values()), duplicates_removed
+
+
+def _analysis_key(paper):
+    """The fields the analyzers read; papers with equal keys get identical results"""
+    return (paper.get('title', ''), paper.get('abstract', ''), paper.get('year'),
+            paper.get('journal'), paper.get('citationCount', 0))
+
+
+def analyze_paper(paper):
+    """Run the five analyzers on a paper and return their results as a tuple"""
+    # Lowercase and keyword-scan the text once and share it across the analyzers
+    text = analyze_text(paper)
+    return (
+        classify_paper_type(paper, text),
+        calculate_clinical_relevance(paper, text),
+        assess_methodology(paper, text),
+        determine_target_audience(paper, text),
+        identify_research_gaps(paper, text)
+    )
 
-        # Add paper type classification
-        enhanced_paper['paper_type'] = classify_paper_type(paper)
 
-        # Add clinical relevance score
-        enhanced_paper['clinical_relevance'] = calculate_clinical_relevance(paper)
+def enhance_papers_metadata(papers):
+    """Enhance paper metadata with additional analysis"""
+
+    papers = list(papers)
+    keys = [_analysis_key(paper) for paper in papers]
 
-        # Add methodology assessment
-        enhanced_paper['methodology'] = assess_methodology(paper)
+    # Records duplicated across databases are analyzed once
+    distinct = {}
+    for key, paper in zip(keys, papers):
+        distinct.setdefault(key, paper)
 
-        # Add target audience
-        enhanced_paper['target_audience'] = determine_target_audience(paper)
+    # The analyzers are CPU-bound pure functions, so spread large batches across
+    # processes; below the threshold worker start-up costs more than it saves
+    if len(distinct) >= PARALLEL_ANALYSIS_THRESHOLD:
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(analyze_paper, distinct.values(), chunksize=64)
+            analyses = dict(zip(distinct, results))
+    else:
+        analyses = {key: analyze_paper(paper) for key, paper in distinct.items()}
+
+    enhanced_papers = []
 
-        # Add research gaps addressed
-        enhanced_paper['research_gaps'] = identify_research_gaps(paper)
+    for key, paper in zip(keys, papers):
+        paper_type, clinical_relevance, methodology, target_audience, research_gaps = analyses[key]
+
+        # Build the enhanced record in one dict display rather than copy() plus five insertions
+        enhanced_paper = {
+            **paper,
+            'paper_type': paper_type,
+            'clinical_relevance': clinical_relevance,
+            # Copied so duplicates never share a mutable dict
+            'methodology': dict(methodology),
+            'target_audience': target_audience,
+            'research_gaps': research_gaps
+        }
 
         enhanced_papers.append(enhanced_paper)
 
     return enhanced_papers
 
 
-def classify_paper_type(paper):
+def classify_paper_type(paper, text):
     """Classify the type of paper based on title and abstract"""
 
-    title = (paper.get('title', '') + ' ' + paper.get('abstract', '')).lower()
-
-    if 'guideline' in title or 'recommendation' in title or 'consensus' in title:
+    if 'guideline' in text.combined_terms or 'recommendation' in text.combined_terms or 'consensus' in text.combined_terms:
         return 'clinical_guideline'
-    elif 'systematic review' in title or 'meta-analysis' in title:
+    elif 'systematic review' in text.combined_terms or 'meta-analysis' in text.combined_terms:
         return 'systematic_review'
-    elif 'randomized' in title or 'trial' in title or 'rct' in title:
+    elif 'randomized' in text.combined_terms or 'trial' in text.combined_terms or 'rct' in text.combined_terms:
         return 'clinical_trial'
-    elif 'machine learning' in title or 'deep learning' in title or 'ai' in title or 'artificial intelligence' in title:
+    elif 'machine learning' in text.combined_terms or 'deep learning' in text.combined_terms or 'ai' in text.combined_terms or 'artificial intelligence' in text.combined_terms:
         return 'machine_learning'
-    elif 'review' in title:
+    elif 'review' in text.combined_terms:
         return 'review_article'
-    elif 'study' in title or 'analysis' in title:
+    elif 'study' in text.combined_terms or 'analysis' in text.combined_terms:
         return 'observational_study'
     else:
         return 'original_research'
 
 
-def calculate_clinical_relevance(paper):
+def calculate_clinical_relevance(paper, text):
     """Calculate clinical relevance score (0-100)"""
 
-    title = (paper.get('title', '')).lower()
-    abstract = (paper.get('abstract', '')).lower()
-
     score = 0
 
     # Clinical keywords (high weight)
-    clinical_keywords = [
-        'patient', 'clinical', 'treatment', 'therapy', 'management',
-        'outcome', 'prognosis', 'diagnosis', 'prevention', 'guideline',
-        'randomized', 'trial', 'study', 'cohort', 'mortality'
-    ]
-
-    for keyword in clinical_keywords:
-        if keyword in title:
-            score += 10
-        if keyword in abstract:
-            score += 5
+    score += 10 * len(CLINICAL_KEYWORDS & text.title_terms)
+    score += 5 * len(CLINICAL_KEYWORDS & text.abstract_terms)
 
     # High-impact clinical topics
-    high_impact_topics = [
-        'stroke prevention', 'anticoagulation', 'catheter ablation',
-        'mortality', 'quality of life', 'guidelines', 'risk stratification'
-    ]
-
-    for topic in high_impact_topics:
-        if topic in abstract:
-            score += 15
+    score += 15 * len(HIGH_IMPACT_TOPICS & text.abstract_terms)
 
     # Recent publications (bonus)
     year = paper.get('year')
@@ -131,99 +399,85 @@ def calculate_clinical_relevance(paper):
 
     # Journal quality (simplified assessment)
     journal = (paper.get('journal') or '').lower()
-    high_impact_journals = [
-        'new england journal', 'lancet', 'jama', 'nature', 'circulation',
-        'european heart', 'journal of american college', 'heart rhythm'
-    ]
-
-    for journal_name in high_impact_journals:
-        if journal_name in journal:
-            score += 15
-            break
+    if HIGH_IMPACT_JOURNALS.search(journal):
+        score += 15
 
     return min(score, 100)
 
 
-def assess_methodology(paper):
+def assess_methodology(paper, text):
     """Assess the methodology strength of the paper"""
 
-    abstract = (paper.get('abstract', '')).lower()
-
     methodology_score = 0
     methodology_type = []
 
     # Study design detection
-    if 'randomized' in abstract and 'trial' in abstract:
+    if 'randomized' in text.abstract_terms and 'trial' in text.abstract_terms:
         methodology_score += 40
         methodology_type.append('randomized_controlled_trial')
-    elif 'systematic review' in abstract or 'meta-analysis' in abstract:
+    elif 'systematic review' in text.abstract_terms or 'meta-analysis' in text.abstract_terms:
         methodology_score += 35
         methodology_type.append('systematic_review')
-    elif 'prospective' in abstract:
+    elif 'prospective' in text.abstract_terms:
         methodology_score += 25
         methodology_type.append('prospective_study')
-    elif 'multicenter' in abstract:
+    elif 'multicenter' in text.abstract_terms:
         methodology_score += 20
         methodology_type.append('multicenter_study')
-    elif 'cohort' in abstract:
+    elif 'cohort' in text.abstract_terms:
         methodology_score += 15
         methodology_type.append('cohort_study')
-    elif 'cross-sectional' in abstract:
+    elif 'cross-sectional' in text.abstract_terms:
         methodology_score += 10
         methodology_type.append('cross_sectional')
 
-    # Sample size assessment
-    import re
-    numbers = re.findall(r'\d+', abstract)
-    for num in numbers:
-        if int(num) >= 10000:
+    # Sample size assessment: the first number of at least 100 sets the bonus
+    for match in SAMPLE_SIZE_RE.finditer(text.abstract):
+        num = int(match.group())
+        if num >= 10000:
             methodology_score += 15
             break
-        elif int(num) >= 1000:
+        elif num >= 1000:
             methodology_score += 10
             break
-        elif int(num) >= 100:
+        elif num >= 100:
             methodology_score += 5
             break
 
     # Statistical methods
-    statistical_terms = ['statistically significant', 'p-value', 'confidence interval',
-                        'hazard ratio', 'odds ratio', 'multivariate', 'adjusted']
-    stat_count = sum(1 for term in statistical_terms if term in abstract)
+    stat_count = len(STATISTICAL_TERMS & text.abstract_terms)
     methodology_score += min(stat_count * 2, 10)
 
     return {
         'score': min(methodology_score, 100),
-        'type': methodology_type,
+        'type': _shared_tags(methodology_type),
         'strength': 'strong' if methodology_score >= 70 else
                    'moderate' if methodology_score >= 40 else 'limited'
     }
 
 
-def determine_target_audience(paper):
+def determine_target_audience(paper, text):
     """Determine the primary target audience for the paper"""
 
-    title = (paper.get('title', '') + ' ' + paper.get('abstract', '')).lower()
-
     audiences = []
 
-    if 'guideline' in title or 'recommendation' in title:
+    if 'guideline' in text.combined_terms or 'recommendation' in text.combined_terms:
         audiences.append('clinicians')
         audiences.append('policy_makers')
 
-    if 'machine learning' in title or 'algorithm' in title or 'computational' in title:
+    if 'machine learning' in text.combined_terms or 'algorithm' in text.combined_terms or 'computational' in text.combined_terms:
         audiences.append('data_scientists')
         audiences.append('researchers')
 
-    if 'treatment' in title or 'therapy' in title or 'management' in title:
+    if 'treatment' in text.combined_terms or 'therapy' in text.combined_terms or 'management' in text.combined_terms:
         audiences.append('cardiologists')
         audiences.append('electrophysiologists')
 
-    if 'diagnosis' in title or 'detection' in title or 'screening' in title:
+    if 'diagnosis' in text.combined_terms or 'detection' in text.combined_terms or 'screening' in text.combined_terms:
         audiences.append('primary_care_physicians')
         audiences.append('cardiologists')
 
-    if 'cost' in title or 'economic' in title or 'healthcare' in title:
+    if 'cost' in text.combined_terms or 'economic' in text.combined_terms or 'healthcare' in text.combined_terms:
         audiences.append('healthcare_administrators')
         audiences.append('policy_makers')
 
@@ -231,35 +485,33 @@ def determine_target_audience(paper):
         audiences.append('researchers')
         audiences.append('clinicians')
 
-    return audiences
+    return _shared_tags(audiences)
 
 
-def identify_research_gaps(paper):
+def identify_research_gaps(paper, text):
     """Identify research gaps addressed by the paper"""
 
-    abstract = paper.get('abstract', '').lower()
-
     gaps = []
 
-    if 'novel' in abstract or 'first' in abstract or 'new' in abstract:
+    if 'novel' in text.abstract_terms or 'first' in text.abstract_terms or 'new' in text.abstract_terms:
         gaps.append('innovative_approach')
 
-    if 'limitations' in abstract or 'future' in abstract or 'need' in abstract:
+    if 'limitations' in text.abstract_terms or 'future' in text.abstract_terms or 'need' in text.abstract_terms:
         gaps.append('addresses_limitations')
 
-    if 'understudied' in abstract or 'rare' in abstract or 'less known' in abstract:
+    if 'understudied' in text.abstract_terms or 'rare' in text.abstract_terms or 'less known' in text.abstract_terms:
         gaps.append('understudied_population')
 
-    if 'comparison' in abstract or 'versus' in abstract or 'compare' in abstract:
+    if 'comparison' in text.abstract_terms or 'versus' in text.abstract_terms or 'compare' in text.abstract_terms:
         gaps.append('comparative_effectiveness')
 
-    if 'real-world' in abstract or 'practice' in abstract:
+    if 'real-world' in text.abstract_terms or 'practice' in text.abstract_terms:
         gaps.append('real_world_evidence')
 
-    if 'long-term' in abstract or 'follow-up' in abstract:
+    if 'long-term' in text.abstract_terms or 'follow-up' in text.abstract_terms:
         gaps.append('long_term_outcomes')
 
-    return gaps if gaps else ['general_research_contribution']
+    return _shared_tags(gaps if gaps else ['general_research_contribution'])
 
 
 def create_analysis_report(enhanced_papers):
@@ -267,36 +519,42 @@ def create_analysis_report(enhanced_papers):
 
     # Statistics
     total_papers = len(enhanced_papers)
-    paper_types = defaultdict(int)
-    methodology_scores = []
-    clinical_relevance_scores = []
-    target_audiences = defaultdict(int)
-    research_gaps = defaultdict(int)
+    paper_types = Counter()
+    methodology_total = 0
+    clinical_relevance_total = 0
+    target_audiences = Counter()
+    research_gaps = Counter()
+
+    # High-quality papers (top 25% by clinical relevance), kept in a bounded min-heap
+    # of (relevance, -index, paper); the unique index keeps papers out of comparisons
+    # and ranks ties in input order as a stable sort would
+    top_papers_count = max(1, int(total_papers * 0.25))
+    top_heap = []
 
-    for paper in enhanced_papers:
+    for index, paper in enumerate(enhanced_papers):
         # Paper type distribution
         paper_types[paper['paper_type']] += 1
 
         # Methodology and clinical relevance scores
-        methodology_scores.append(paper['methodology']['score'])
-        clinical_relevance_scores.append(paper['clinical_relevance'])
+        relevance = paper['clinical_relevance']
+        methodology_total += paper['methodology']['score']
+        clinical_relevance_total += relevance
 
-        # Target audiences
-        for audience in paper['target_audience']:
-            target_audiences[audience] += 1
+        entry = (relevance, -index, paper)
+        if len(top_heap) < top_papers_count:
+            heapq.heappush(top_heap, entry)
+        elif entry > top_heap[0]:
+            heapq.heapreplace(top_heap, entry)
 
-        # Research gaps
-        for gap in paper['research_gaps']:
-            research_gaps[gap] += 1
+        # Target audiences and research gaps (Counter.update tallies in C)
+        target_audiences.update(paper['target_audience'])
+        research_gaps.update(paper['research_gaps'])
 
     # Calculate averages
-    avg_methodology_score = sum(methodology_scores) / len(methodology_scores) if methodology_scores else 0
-    avg_clinical_relevance = sum(clinical_relevance_scores) / len(clinical_relevance_scores) if clinical_relevance_scores else 0
+    avg_methodology_score = methodology_total / total_papers if total_papers else 0
+    avg_clinical_relevance = clinical_relevance_total / total_papers if total_papers else 0
 
-    # High-quality papers (top 25% by clinical relevance)
-    sorted_by_relevance = sorted(enhanced_papers, key=lambda x: x['clinical_relevance'], reverse=True)
-    top_papers_count = max(1, int(total_papers * 0.25))
-    top_papers = sorted_by_relevance[:top_papers_count]
+    top_papers = [paper for _, _, paper in sorted(top_heap, reverse=True)]
 
     report = {
         "analysis_metadata": {
@@ -348,10 +606,14 @@ def main():
     if not search_data:
         return
 
-    papers = search_data.get('results', [])
+    # Identical text loaded from separate records is kept in memory once
+    papers = _intern_strings(search_data.get('results', []))
     metadata = search_data.get('metadata', {})
 
-    print(f"Loaded {len(papers)} papers for processing")
+    # Drop duplicate records before the analyzers run (papers may be a stream, so count here)
+    papers, duplicates_removed = deduplicate_papers(papers)
+    print(f"Loaded {len(papers) + duplicates_removed} papers for processing")
+    print(f"Removed {duplicates_removed} duplicate papers")
 
     # Enhance papers with additional metadata
     enhanced_papers = enhance_papers_metadata(papers)
@@ -368,49 +630,48 @@ def main():
 
     # Save enhanced papers
     enhanced_file = output_dir / f"enhanced_papers_{timestamp}.json"
-    enhanced_data = {
-        "metadata": {
-            **metadata,
-            "processing_timestamp": datetime.now().isoformat(),
-            "processing_type": "comprehensive_enhancement"
-        },
-        "results": enhanced_papers
+    enhanced_metadata = {
+        **metadata,
+        "processing_timestamp": datetime.now().isoformat(),
+        "processing_type": "comprehensive_enhancement",
+        "duplicates_removed": duplicates_removed
     }
 
-    with open(enhanced_file, 'w', encoding='utf-8') as f:
-        json.dump(enhanced_data, f, indent=2, ensure_ascii=False)
+    _write_results_json(enhanced_file, enhanced_metadata, enhanced_papers)
 
     # Save analysis report
     analysis_file = output_dir / f"analysis_report_{timestamp}.json"
-    with open(analysis_file, 'w', encoding='utf-8') as f:
-        json.dump(analysis_report, f, indent=2, ensure_ascii=False)
+    _write_json(analysis_file, analysis_report)
 
     # Create human-readable summary
     summary_file = output_dir / f"post_processing_summary_{timestamp}.md"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write("# Atrial Fibrillation Search Results - Post-Processing Summary\n\n")
-        f.write(f"**Processing Date:** {datetime.now().isoformat()}\n")
-        f.write(f"**Total Papers Analyzed:** {analysis_report['analysis_metadata']['total_papers_analyzed']}\n\n")
-
-        f.write("## Paper Type Distribution\n\n")
-        for paper_type, count in analysis_report['paper_type_distribution'].items():
-            f.write(f"- {paper_type.replace('_', ' ').title()}: {count} papers\n")
-
-        f.write(f"\n## Quality Metrics\n\n")
-        f.write(f"- **Average Methodology Score:** {analysis_report['quality_metrics']['average_methodology_score']}/100\n")
-        f.write(f"- **Average Clinical Relevance:** {analysis_report['quality_metrics']['average_clinical_relevance']}/100\n")
-        f.write(f"- **High-Quality Papers:** {analysis_report['quality_metrics']['high_quality_papers_count']}\n\n")
-
-        f.write("## Top 5 Papers by Clinical Relevance\n\n")
-        for paper in analysis_report['top_papers_by_relevance'][:5]:
-            f.write(f"**{paper['rank']}.** {paper['title']}\n")
-            f.write(f"   - Clinical Relevance: {paper['clinical_relevance']}/100\n")
-            f.write(f"   - Methodology Score: {paper['methodology_score']}/100\n")
-            f.write(f"   - Type: {paper['paper_type'].replace('_', ' ').title()}\n\n")
-
-        f.write("## Recommendations for Next Phase\n\n")
-        for rec in analysis_report['recommendations_for_next_phase']:
-            f.write(f"- {rec}\n")
+    parts = []
+    parts.append("# Atrial Fibrillation Search Results - Post-Processing Summary\n\n")
+    parts.append(f"**Processing Date:** {datetime.now().isoformat()}\n")
+    parts.append(f"**Total Papers Analyzed:** {analysis_report['analysis_metadata']['total_papers_analyzed']}\n\n")
+
+    parts.append("## Paper Type Distribution\n\n")
+    for paper_type, count in analysis_report['paper_type_distribution'].items():
+        parts.append(f"- {paper_type.replace('_', ' ').title()}: {count} papers\n")
+
+    parts.append(f"\n## Quality Metrics\n\n")
+    parts.append(f"- **Average Methodology Score:** {analysis_report['quality_metrics']['average_methodology_score']}/100\n")
+    parts.append(f"- **Average Clinical Relevance:** {analysis_report['quality_metrics']['average_clinical_relevance']}/100\n")
+    parts.append(f"- **High-Quality Papers:** {analysis_report['quality_metrics']['high_quality_papers_count']}\n\n")
+
+    parts.append("## Top 5 Papers by Clinical Relevance\n\n")
+    for paper in analysis_report['top_papers_by_relevance'][:5]:
+        parts.append(f"**{paper['rank']}.** {paper['title']}\n")
+        parts.append(f"   - Clinical Relevance: {paper['clinical_relevance']}/100\n")
+        parts.append(f"   - Methodology Score: {paper['methodology_score']}/100\n")
+        parts.append(f"   - Type: {paper['paper_type'].replace('_', ' ').title()}\n\n")
+
+    parts.append("## Recommendations for Next Phase\n\n")
+    for rec in analysis_report['recommendations_for_next_phase']:
+        parts.append(f"- {rec}\n")
+
+    # Assemble the summary in memory and write it with a single call
+    summary_file.write_text("".join(parts), encoding='utf-8')
 
     print(f"\n=== POST-PROCESSING COMPLETE ===")
     print(f"Enhanced papers saved to: {enhanced_file}")
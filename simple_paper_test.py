@@ -3,12 +3,20 @@
 Simple test for Paper Reader Agent without external dependencies
 """
 
+import functools
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath('.'))
 
+@functools.lru_cache(maxsize=None)
+def _read(path):
+    """Read a source file once and reuse its contents across checks"""
+    with open(path, 'r') as f:
+        return f.read()
+
 def test_basic_structure():
     """Test basic file structure and imports"""
     print("🔍 Testing basic structure...")
@@ -33,6 +41,14 @@ def test_basic_structure():
 
     return True
 
+def _compile_error(file_path):
+    """Compile a source file, returning the exception raised (if any)"""
+    try:
+        compile(_read(file_path), file_path, 'exec')
+    except Exception as e:
+        return e
+    return None
+
 def test_syntax_validation():
     """Test Python syntax for all files"""
     print("🔍 Testing syntax validation...")
@@ -46,17 +62,18 @@ def test_syntax_validation():
         'agents/paper_analysis/finding_extractor.py'
     ]
 
-    for file_path in files_to_check:
-        try:
-            with open(file_path, 'r') as f:
-                code = f.read()
-            compile(code, file_path, 'exec')
+    # Compile the files concurrently, then report in the original order
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        errors = list(executor.map(_compile_error, files_to_check))
+
+    for file_path, error in zip(files_to_check, errors):
+        if error is None:
             print(f"  ✅ {os.path.basename(file_path)} syntax valid")
-        except SyntaxError as e:
-            print(f"  ❌ {os.path.basename(file_path)} syntax error: {e}")
+        elif isinstance(error, SyntaxError):
+            print(f"  ❌ {os.path.basename(file_path)} syntax error: {error}")
             return False
-        except Exception as e:
-            print(f"  ❌ {os.path.basename(file_path)} error: {e}")
+        else:
+            print(f"  ❌ {os.path.basename(file_path)} error: {error}")
             return False
 
     return True
@@ -75,8 +92,7 @@ def test_class_definitions():
 
     for file_path, expected in expected_classes.items():
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
+            content = _read(file_path)
 
             for class_name in expected:
                 if f'class {class_name}' in content:
@@ -105,8 +121,7 @@ def test_method_definitions():
 
     for file_path, class_name, expected_methods in method_checks:
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
+            content = _read(file_path)
 
             # Find class content (simplified)
             class_start = content.find(f'class {class_name}')
@@ -143,8 +158,7 @@ def test_documentation():
 
     for file_path in doc_checks:
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
+            content = _read(file_path)
 
             # Check for docstrings
             if '"""' in content:
@@ -158,8 +172,7 @@ def test_documentation():
 
     # Check README
     if os.path.exists('agents/paper_analysis/README.md'):
-        with open('agents/paper_analysis/README.md', 'r') as f:
-            readme = f.read()
+        readme = _read('agents/paper_analysis/README.md')
         if len(readme) > 1000:  # Reasonable length
             print(f"  ✅ README.md comprehensive ({len(readme)} characters)")
         else:
@@ -3,30 +3,31 @@
 Simple Milestone 1 Validation Script
 """
 
+import functools
 import os
 import re
 
-def check_method_exists(file_path, class_name, method_name):
-    """Check if a method exists in a class"""
-    try:
-        with open(file_path, 'r') as f:
-            content = f.read()
-
-        # Find class definition
-        class_pattern = rf'class {class_name}[^:]*:'
-        class_match = re.search(class_pattern, content)
+@functools.lru_cache(maxsize=None)
+def _read(path):
+    """Read a source file once and reuse its contents across checks"""
+    with open(path, 'r') as f:
+        return f.read()
 
-        if not class_match:
-            return False
+CLASS_BODY_RE = re.compile(r'^class (\w+)[^:]*:(.*?)(?=^class |\Z)', re.DOTALL | re.MULTILINE)
+METHOD_DEF_RE = re.compile(r'def (\w+)\s*\(')
 
-        # Extract class content (simplified)
-        class_start = class_match.end()
-        remaining_content = content[class_start:]
-
-        # Look for method in class
-        method_pattern = rf'def {method_name}\s*\('
-        return bool(re.search(method_pattern, remaining_content))
+@functools.lru_cache(maxsize=None)
+def _class_methods(file_path):
+    """Map each top-level class in a file to the set of methods it defines"""
+    class_methods = {}
+    for class_name, body in CLASS_BODY_RE.findall(_read(file_path)):
+        class_methods.setdefault(class_name, set()).update(METHOD_DEF_RE.findall(body))
+    return class_methods
 
+def check_method_exists(file_path, class_name, method_name):
+    """Check if a method exists in a class"""
+    try:
+        return method_name in _class_methods(file_path).get(class_name, ())
     except Exception:
         return False
 
@@ -82,8 +83,7 @@ def validate_test_count():
 
     for test_file in test_files:
         if os.path.exists(test_file):
-            with open(test_file, 'r') as f:
-                content = f.read()
+            content = _read(test_file)
 
             # Count test methods
             test_methods = len(re.findall(r'def test_[^(]*\(', content))